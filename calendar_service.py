@@ -8,7 +8,14 @@ from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
 from models import Event
-from store import StorageError, load_events, save_events, upsert_event
+from store import (
+    StorageError,
+    delete_event,
+    load_events,
+    sync_events,
+    upsert_event,
+    upsert_events_bulk,
+)
 
 
 class CalendarService:
@@ -16,6 +23,7 @@ class CalendarService:
 
     def __init__(self, data_path: Path) -> None:
         self._data_path = data_path
+        self._unsynced = False
 
     @property
     def data_path(self) -> Path:
@@ -62,30 +70,37 @@ class CalendarService:
         replace_dt: Tuple[bool, Event | None] = (False, None),
     ) -> List[Event]:
         """Insert or update an event and return the updated list."""
-        return upsert_event(
+        updated = upsert_event(
             self._data_path,
             events,
             new_event,
             replace_dt=replace_dt,
         )
+        self._unsynced = True
+        return updated
+
+    def upsert_events_bulk(
+        self,
+        events: List[Event],
+        updates: Iterable[Tuple[Event, Tuple[bool, Event | None]]],
+    ) -> List[Event]:
+        """Apply several inserts/updates with a single write to storage."""
+        updated = upsert_events_bulk(self._data_path, events, updates)
+        self._unsynced = True
+        return updated
 
     def delete_event(self, events: List[Event], target: Event) -> List[Event]:
-        """Remove an event that exactly matches the target."""
-        remaining = [
-            ev
-            for ev in events
-            if not (
-                ev.bucket == target.bucket
-                and ev.jtbd.x == target.jtbd.x
-                and ev.jtbd.y == target.jtbd.y
-                and ev.jtbd.z == target.jtbd.z
-                and ev.nsm.p == target.nsm.p
-                and ev.nsm.q == target.nsm.q
-                and ev.nsm.r == target.nsm.r
-            )
-        ]
-        save_events(self._data_path, remaining)
-        return remaining
+        """Remove every event that exactly matches the target."""
+        updated = delete_event(self._data_path, events, target)
+        self._unsynced = True
+        return updated
+
+    def sync(self) -> None:
+        """fsync storage once for every write made since the last sync."""
+        if not self._unsynced:
+            return
+        sync_events(self._data_path)
+        self._unsynced = False
 
 
 __all__ = ["CalendarService", "StorageError"]
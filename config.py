@@ -16,9 +16,12 @@ from paths import ensure_dir, xdg_config_home
 @dataclass
 class Config:
     data_csv_path: Path
+    max_fps: int = 60
+    inline_edit: bool = False
 
 
 DEFAULT_DATA_FILENAME = "event.csv"
+DEFAULT_MAX_FPS = 60
 CONFIG_FILENAME = "config.json"
 
 
@@ -64,9 +67,22 @@ def load_config() -> Config:
 
     return Config(
         data_csv_path=data_path,
+        max_fps=_parse_max_fps(raw.get("max_fps")),
+        inline_edit=raw.get("inline_edit") is True,
     )
 
 
+def _parse_max_fps(value: Any) -> int:
+    """Return a positive frame cap, falling back to the default."""
+    if isinstance(value, bool):
+        return DEFAULT_MAX_FPS
+    try:
+        fps = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_FPS
+    return fps if fps > 0 else DEFAULT_MAX_FPS
+
+
 def _strip_trailing_commas(text: str) -> str:
     """Remove trailing commas before closing braces/brackets."""
     return re.sub(r",(\s*[}\]])", r"\1", text)
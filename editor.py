@@ -6,10 +6,10 @@ from __future__ import annotations
 import json
 import shlex
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import List, Tuple
 
+from paths import scratch_dir
 from models import Event, ValidationError, event_to_jsonable, normalize_event_payload
 
 
@@ -24,11 +24,15 @@ def edit_event_via_editor(
 
     Returns (ok, Events_or_error_message)
     """
+    import tempfile
+
     if isinstance(seed_events, Event):
         payload = event_to_jsonable(seed_events)
     else:
         payload = [event_to_jsonable(ev) for ev in seed_events]
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(
+        mode="w+", suffix=".json", delete=False, dir=scratch_dir()
+    ) as tmp:
         tmp_path = Path(tmp.name)
         json.dump(payload, tmp, indent=2)
         tmp.flush()
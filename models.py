@@ -3,9 +3,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Literal, Sequence
+from typing import Dict, Optional, Literal, Sequence, Tuple
 
 DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
 
@@ -16,11 +16,17 @@ BUCKETS: Sequence[BucketName] = (
     "thing",
     "economic",
 )
+# Maps normalized input to the shared BUCKETS string objects, so bucket
+# comparisons between events usually succeed on the identity check.
+CANONICAL_BUCKETS: Dict[str, BucketName] = {name: name for name in BUCKETS}
 ALL_BUCKET = "all"
 DEFAULT_BUCKET: BucketName = "personal_development"
 
+# Every field of an event; used to match rows across reloads and edits.
+EventIdentity = Tuple[str, datetime, str, str, float, float, float]
 
-@dataclass
+
+@dataclass(slots=True)
 class JTBD:
     x: datetime
     y: str
@@ -40,7 +46,7 @@ class JTBD:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NorthStarMetrics:
     p: float
     q: float
@@ -60,11 +66,31 @@ class NorthStarMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     bucket: BucketName
     jtbd: JTBD
     nsm: NorthStarMetrics
+    # Filled on first access to ``identity``; a slot keeps Event dict-free.
+    _identity: EventIdentity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def identity(self) -> EventIdentity:
+        """Field tuple built once per event; events are replaced, not mutated."""
+        identity = self._identity
+        if identity is None:
+            identity = self._identity = (
+                self.bucket,
+                self.jtbd.x,
+                self.jtbd.y,
+                self.jtbd.z,
+                self.nsm.p,
+                self.nsm.q,
+                self.nsm.r,
+            )
+        return identity
 
     def with_updated(
         self,
@@ -116,10 +142,11 @@ def _normalize_bucket(raw_bucket: object | None) -> BucketName:
     if raw_bucket is None:
         raise ValidationError("Missing 'bucket' field")
     bucket = str(raw_bucket).strip().lower()
-    if bucket not in BUCKETS:
+    canonical = CANONICAL_BUCKETS.get(bucket)
+    if canonical is None:
         valid = ", ".join(BUCKETS)
         raise ValidationError(f"Invalid bucket '{bucket}'. Expected one of: {valid}")
-    return bucket  # type: ignore[return-value]
+    return canonical
 
 
 def _extract_jtbd(data: dict) -> JTBD:
@@ -181,6 +208,16 @@ def normalize_event_payload(data: dict) -> Event:
     return Event(bucket=bucket, jtbd=jtbd, nsm=nsm)
 
 
+def format_metric(value: float) -> str:
+    # Whole scores are the common case and need no rounding or stripping.
+    if value and value % 1 == 0:
+        return str(int(value))
+    text = f"{value:.2f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
 def event_to_jsonable(event: Event) -> dict:
     return {
         "bucket": event.bucket,
@@ -205,9 +242,12 @@ __all__ = [
     "parse_datetime",
     "normalize_event_payload",
     "event_to_jsonable",
+    "format_metric",
     "DATETIME_FMT",
     "BucketName",
     "BUCKETS",
+    "CANONICAL_BUCKETS",
     "ALL_BUCKET",
     "DEFAULT_BUCKET",
+    "EventIdentity",
 ]
@@ -9,13 +9,11 @@ import os
 import shlex
 import shutil
 import subprocess
-import sys
-import tempfile
 import textwrap
 import time
 from pathlib import Path
-from datetime import date, datetime
-from typing import List, cast
+from datetime import date, datetime, time as dt_time
+from typing import Callable, List, cast
 import re
 
 from calendar_service import CalendarService, StorageError
@@ -53,27 +51,56 @@ from models import (
     normalize_event_payload,
     parse_datetime,
     event_to_jsonable,
+    format_metric,
     BUCKETS,
+    CANONICAL_BUCKETS,
     BucketName,
     DEFAULT_BUCKET,
     ALL_BUCKET,
 )
-from state import AppState
+from state import AppState, DirtyFlags, PendingDelete
 from help_content import HELP_LINES
-from ui_base import clamp, draw_centered_box, draw_footer, draw_help_overlay
+from paths import scratch_dir
+from ui_base import (
+    build_lines_pad,
+    clamp,
+    doupdate_synchronized,
+    draw_centered_box,
+    draw_footer,
+    prompt_line,
+    supports_synchronized_output,
+)
 from view_agenda import AgendaView
 from view_month import MonthView
 
 LEADER_TIMEOUT_MS = 1000
 DELETE_TIMEOUT_MS = 600
-SEEDED_DEFAULT_TIME = "23:59:59"
+SEEDED_DEFAULT_TIME = dt_time(23, 59, 59)
+OVERLAY_DISMISS_HINT = "Press any key to dismiss"
+# Upper bound on queued keys handled before a redraw is forced.
+INPUT_DRAIN_LIMIT = 16
+# Agenda bucket filters in cycling order, with each filter's position.
+BUCKET_CYCLE: tuple[str, ...] = (ALL_BUCKET, *BUCKETS)
+_BUCKET_CYCLE_INDEX = {name: idx for idx, name in enumerate(BUCKET_CYCLE)}
+INVALID_BUCKET_MESSAGE = "Invalid bucket '{}'. Expected one of: " + ", ".join(BUCKETS)
+
+
+def _monotonic_ms() -> int:
+    return time.monotonic_ns() // 1_000_000
 
 
-def _format_metric_value(value: float) -> str:
-    text = f"{value:.2f}"
-    if "." in text:
-        text = text.rstrip("0").rstrip(".")
-    return text
+def _dirty_all_if(handled: bool) -> DirtyFlags:
+    """Map an editor flow's handled flag to a full repaint."""
+    return DirtyFlags.ALL if handled else DirtyFlags.NONE
+
+
+def _split_editor_cmd(editor_cmd: str) -> List[str]:
+    """Split $EDITOR into argv, falling back to vim when blank or malformed."""
+    try:
+        cmd = shlex.split(editor_cmd)
+    except ValueError:
+        return ["vim"]
+    return cmd or ["vim"]
 
 
 def _format_nsm_json(event: Event) -> str:
@@ -162,12 +189,28 @@ class Orchestrator:
         self.config = load_config()
         self.calendar = CalendarService(self.config.data_csv_path)
         self.state = AppState()
-        self.last_tick_ms = 0
-        self._pending_delete = {
-            "active": False,
-            "started_at": 0,
-            "target_view": "agenda",
-        }
+        # $EDITOR is read once; launchers reuse the pre-split argv.
+        self._editor_cmd = os.environ.get("EDITOR", "vim")
+        self._editor_argv = _split_editor_cmd(self._editor_cmd)
+        # Keys handled within one frame budget share a single redraw.
+        self._frame_budget_ns = 1_000_000_000 // self.config.max_fps
+        self._last_draw_ns = 0
+        self._pending_delete = PendingDelete()
+        self._screen_size: tuple[int, int] | None = None
+        self._body_win: "curses.window | None" = None  # type: ignore[name-defined]
+        self._last_footer: str | None = None
+        # What the body last showed; None once anything else drew over it.
+        self._last_body_sig: tuple | None = None
+        # Frames are committed atomically on terminals known to support it.
+        self._sync_output = supports_synchronized_output(os.environ)
+        self._help_pad: tuple[int, "curses.window"] | None = None  # type: ignore[name-defined]
+        # Views per bucket filter, valid while events_version is unchanged.
+        self._view_cache_version = -1
+        self._agenda_views: dict[str, AgendaView] = {}
+        self._month_views: dict[str, MonthView] = {}
+        # Refreshed at most once per second from the main loop.
+        self._today: date = date.today()
+        self._today_tick = 0
 
     def run(self) -> int:
         return self._run_curses()
@@ -205,7 +248,7 @@ class Orchestrator:
             return 1
 
         print(json.dumps(event_to_jsonable(event), indent=2))
-        self.state.events = updated
+        self._set_events(updated)
         self._prune_row_overrides()
         return 0
 
@@ -245,15 +288,14 @@ class Orchestrator:
         seed_event = Event(
             bucket=DEFAULT_BUCKET,
             jtbd=JTBD(
-                x=parse_datetime(f"{date.today().strftime('%Y-%m-%d')} {SEEDED_DEFAULT_TIME}"),
+                x=datetime.combine(date.today(), SEEDED_DEFAULT_TIME),
                 y="",
                 z="",
             ),
             nsm=NorthStarMetrics(p=0.0, q=0.0, r=0.0),
         )
-        editor_cmd = os.environ.get("EDITOR", "vim")
         ok, contents, error = self._launch_json_editor(
-            editor_cmd, _row_editor_seed(seed_event)
+            self._editor_argv, _row_editor_seed(seed_event)
         )
         if not ok:
             if error:
@@ -323,9 +365,8 @@ class Orchestrator:
             print(f"ID {item_id} not found in CSV")
             return 1
 
-        editor_cmd = os.environ.get("EDITOR", "vim")
         ok, contents, error = self._launch_json_editor(
-            editor_cmd, _row_editor_seed(original)
+            self._editor_argv, _row_editor_seed(original)
         )
         if not ok:
             if error:
@@ -547,10 +588,10 @@ class Orchestrator:
             z_lines = z_wrapper.wrap(ev.jtbd.z) or [f"{line_indent}z:"]
             avg = (ev.nsm.p + ev.nsm.q + ev.nsm.r) / 3.0
             score_line = (
-                f"{line_indent}p: {_format_metric_value(ev.nsm.p)}  "
-                f"q: {_format_metric_value(ev.nsm.q)}  "
-                f"r: {_format_metric_value(ev.nsm.r)}  "
-                f"avg: {_format_metric_value(avg)}"
+                f"{line_indent}p: {format_metric(ev.nsm.p)}  "
+                f"q: {format_metric(ev.nsm.q)}  "
+                f"r: {format_metric(ev.nsm.r)}  "
+                f"avg: {format_metric(avg)}"
             )
             bucket_line = f"{line_indent}bucket: {ev.bucket}"
 
@@ -574,12 +615,21 @@ class Orchestrator:
         except curses.error as exc:
             print(f"curses error: {exc}")
             return 1
+        finally:
+            self._sync_storage()
         return 0
 
+    def _sync_storage(self) -> None:
+        # Edits write without fsync; flush them to disk once per session.
+        try:
+            self.calendar.sync()
+        except StorageError as exc:
+            print(f"Storage error: {exc}")
+
     def _curses_main(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
         curses.curs_set(0)
-        stdscr.nodelay(True)
-        stdscr.timeout(100)
+        # No fixed poll interval: the loop sets getch's timeout from the
+        # pending leader/delete/frame deadlines, blocking when idle.
         stdscr.keypad(True)
         try:
             curses.start_color()
@@ -593,71 +643,205 @@ class Orchestrator:
 
         # Initial load
         try:
-            self.state.events = self.calendar.load_events()
+            self._set_events(self.calendar.load_events())
             self.state.overlay = "none"
             self.state.overlay_message = ""
             self._prune_row_overrides()
         except StorageError as exc:
             self.state.overlay = "error"
             self.state.overlay_message = f"Storage error: {exc}"
-            self.state.events = []
+            self._set_events([])
 
+        self._refresh_today(_monotonic_ms())
         self._draw(stdscr)
 
         while True:
+            timeout_at = self._next_timeout_ms()
+            stdscr.timeout(self._input_timeout_ms(_monotonic_ms(), timeout_at))
             ch = stdscr.getch()
-            now_ms = int(time.time() * 1000)
-            self._maybe_timeout_leader(now_ms)
-            self._maybe_timeout_delete(now_ms)
+            now_ms = _monotonic_ms()
+            self._refresh_today(now_ms)
+            # Timeouts fire once strictly past the deadline.
+            if timeout_at is not None and now_ms > timeout_at:
+                self._fire_timeouts(now_ms)
 
             if ch in (-1, curses.ERR):
+                # Either a pending timeout expired or a capped frame is due.
+                self._draw_if_due(stdscr)
                 continue
             if ch in (KEY_Q, KEY_CAP_Q):
                 break
 
-            handled = self._handle_key(stdscr, ch)
-            if handled:
-                self._draw(stdscr)
+            self._mark_dirty(self._handle_key(stdscr, ch, now_ms))
+            quit_requested = False
+            # Drain keys that queued up meanwhile (e.g. a held j) so a burst
+            # costs a single redraw.
+            stdscr.timeout(0)
+            for _ in range(INPUT_DRAIN_LIMIT):
+                nxt = stdscr.getch()
+                if nxt in (-1, curses.ERR):
+                    break
+                if nxt in (KEY_Q, KEY_CAP_Q):
+                    quit_requested = True
+                    break
+                # Drained keys arrived together; they share this tick's now_ms.
+                self._mark_dirty(self._handle_key(stdscr, nxt, now_ms))
+            if quit_requested:
+                break
+            self._draw_if_due(stdscr)
 
     # Rendering
+    def _draw_if_due(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
+        """Draw pending changes unless the last frame is within the budget.
+
+        A deferred frame stays dirty; _input_timeout_ms wakes the loop once
+        the budget has elapsed.
+        """
+        if not self.state.dirty:
+            return
+        if time.monotonic_ns() - self._last_draw_ns < self._frame_budget_ns:
+            return
+        self._draw(stdscr)
+
     def _draw(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
-        stdscr.erase()
+        self._last_draw_ns = time.monotonic_ns()
+        flags = self.state.dirty or DirtyFlags.ALL
+        self.state.dirty = DirtyFlags.NONE
+
+        size = stdscr.getmaxyx()
+        if size != self._screen_size:
+            self._screen_size = size
+            height, width = size
+            self._body_win = (
+                stdscr.derwin(height - 1, width, 0, 0) if height > 1 else None
+            )
+            stdscr.erase()
+            self._last_footer = None
+            self._last_body_sig = None
+            flags = DirtyFlags.ALL
 
         if self.state.help_visible:
-            height, _ = stdscr.getmaxyx()
-            total = len(HELP_LINES)
-            max_visible = max(1, height - 1)
-            max_scroll = max(0, total - max_visible)
-            scroll = clamp(self.state.help_scroll, 0, max_scroll)
-            start = scroll + 1 if total else 0
-            end = min(total, scroll + max_visible) if total else 0
-            footer = (
-                f"HELP {start}-{end}/{total}  |  j/k scroll  |  Ctrl+J/K page  |  ? or Esc close"
-                if total
-                else "HELP — no entries"
-            )
-            self.state.help_scroll = draw_help_overlay(
-                stdscr, HELP_LINES, scroll=scroll, footer=footer
-            )
-            stdscr.refresh()
+            self._draw_help(stdscr, size)
+            doupdate_synchronized(self._sync_output)
             return
 
-        footer = "? help — x=trigger y=outcome z=impact p/q/r scores"
-        footer = f"{footer}  |  bucket: {self.state.agenda_bucket_filter}"
-        if self.state.view == "month":
-            focus_label = (
-                "focus:list" if self.state.month_focus == "events" else "focus:month"
-            )
-            footer = f"{footer}  |  {focus_label}"
-        if self.state.leader.active:
-            leader_seq = f",{self.state.leader.sequence}"
-            footer = f"{footer}  |  {leader_seq}"
+        if flags & DirtyFlags.FOOTER:
+            footer = "? help — x=trigger y=outcome z=impact p/q/r scores"
+            footer = f"{footer}  |  bucket: {self.state.agenda_bucket_filter}"
+            if self.state.view == "month":
+                focus_label = (
+                    "focus:list" if self.state.month_focus == "events" else "focus:month"
+                )
+                footer = f"{footer}  |  {focus_label}"
+            if self.state.leader.active:
+                leader_seq = f",{self.state.leader.sequence}"
+                footer = f"{footer}  |  {leader_seq}"
+            # A flagged footer often reads the same (e.g. leader cancel
+            # after a no-op); stdscr still holds it, so skip the write.
+            if footer != self._last_footer:
+                draw_footer(stdscr, footer)
+                self._last_footer = footer
+
+        if flags & DirtyFlags.BODY:
+            self._draw_body(stdscr)
+        elif flags & DirtyFlags.SELECTION and not self._repaint_selection(stdscr):
+            self._draw_body(stdscr)
+
+        stdscr.noutrefresh()
+        # The overlay box sits on top of the view, so repainting the view
+        # means repainting the box as well.
+        overlay_flags = DirtyFlags.OVERLAY | DirtyFlags.BODY | DirtyFlags.SELECTION
+        if self.state.overlay != "none" and flags & overlay_flags:
+            self._render_overlay(stdscr)
+        doupdate_synchronized(self._sync_output)
+
+    def _draw_help(
+        self, stdscr: "curses.window", size: tuple[int, int]
+    ) -> None:  # type: ignore[name-defined]
+        height, width = size
+        total = len(HELP_LINES)
+        max_visible = max(1, height - 1)
+        max_scroll = max(0, total - max_visible)
+        scroll = clamp(self.state.help_scroll, 0, max_scroll)
+        self.state.help_scroll = scroll
+        start = scroll + 1 if total else 0
+        end = min(total, scroll + max_visible) if total else 0
+        footer = (
+            f"HELP {start}-{end}/{total}  |  j/k scroll  |  Ctrl+J/K page  |  ? or Esc close"
+            if total
+            else "HELP — no entries"
+        )
+        stdscr.erase()
         draw_footer(stdscr, footer)
+        # The help footer replaced the main one.
+        self._last_footer = None
+        self._last_body_sig = None
+        stdscr.noutrefresh()
+        if not total or height < 2 or width < 2:
+            return
+        # The help text is static, so it is rendered into a pad once per
+        # width and each frame only copies the visible slice.
+        if self._help_pad is None or self._help_pad[0] != width:
+            self._help_pad = (width, build_lines_pad(HELP_LINES, width - 1))
+        rows = min(max_visible, total - scroll)
+        self._help_pad[1].noutrefresh(scroll, 0, 0, 0, rows - 1, width - 2)
+
+    def _draw_body(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
+        if self._body_signature(stdscr) == self._last_body_sig:
+            # A body flag from a key that changed nothing visible (e.g. j on
+            # the last row); the screen already shows this state.
+            return
+        if self._body_win is not None:
+            # Clear stale rows through the body subwindow; its own
+            # noutrefresh is needed since the parent does not see the
+            # subwindow's touched lines.
+            self._body_win.erase()
+            self._body_win.noutrefresh()
+        self._draw_view(stdscr)
+        self._last_body_sig = self._body_signature(stdscr)
+
+    def _body_signature(self, stdscr: "curses.window") -> tuple:  # type: ignore[name-defined]
+        """Everything the body render reads; views are rebuilt on edits."""
+        state = self.state
+        shared = (
+            stdscr.getmaxyx(),
+            state.agenda_expand_all,
+            frozenset(state.agenda_row_overrides),
+        )
+        if state.view == "agenda":
+            return (
+                self._get_agenda_view(),
+                state.agenda_index,
+                state.agenda_scroll,
+                state.agenda_col,
+            ) + shared
+        return (
+            self._get_month_view(),
+            state.month_selected_date,
+            state.month_focus,
+            state.month_event_index,
+            state.month_event_col,
+            state.agenda_bucket_filter,
+            self._today,
+        ) + shared
+
+    def _repaint_selection(self, stdscr: "curses.window") -> bool:  # type: ignore[name-defined]
+        """Patch only the agenda rows whose highlight changed, if possible."""
+        if self.state.view != "agenda":
+            return False
+        scroll = self._get_agenda_view().repaint_selection(
+            stdscr, self.state.agenda_index, self.state.agenda_col
+        )
+        if scroll is None:
+            return False
+        self.state.agenda_scroll = scroll
+        self._last_body_sig = None
+        return True
 
+    def _draw_view(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
         if self.state.view == "agenda":
-            visible_events = self._visible_agenda_events()
-            self._ensure_agenda_index_bounds(len(visible_events))
-            view = AgendaView(visible_events)
+            view = self._get_agenda_view()
+            self._ensure_agenda_index_bounds(len(view.events))
             self.state.agenda_scroll = view.render(
                 stdscr,
                 self.state.agenda_index,
@@ -667,10 +851,11 @@ class Orchestrator:
                 row_overrides=self.state.agenda_row_overrides,
             )
         else:
-            filtered_events = self._bucket_filtered_events()
-            view = MonthView(filtered_events)
-            self.state.month_event_index = view.clamp_event_index(
-                self.state.month_selected_date, self.state.month_event_index
+            view = self._get_month_view()
+            self.state.month_event_index = MonthView.clamp_event_index(
+                view.events_by_date,
+                self.state.month_selected_date,
+                self.state.month_event_index,
             )
             self.state.month_event_col = max(
                 0, min(self.state.month_event_col, MonthView.EVENT_COLUMN_COUNT - 1)
@@ -684,113 +869,134 @@ class Orchestrator:
                 expand_all=self.state.agenda_expand_all,
                 row_overrides=self.state.agenda_row_overrides,
                 bucket_label=self.state.agenda_bucket_filter,
+                today=self._today,
             )
 
-        if self.state.overlay != "none":
-            self._render_overlay(stdscr)
-
-        stdscr.refresh()
+    def _mark_dirty(self, flags: DirtyFlags) -> None:
+        self.state.dirty |= flags
 
     def _render_overlay(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
+        # The box covers part of the body, which must repaint once it closes.
+        self._last_body_sig = None
         if self.state.overlay in ("error", "message"):
             draw_centered_box(
-                stdscr, [self.state.overlay_message, "", "Press any key to dismiss"]
+                stdscr, (self.state.overlay_message, "", OVERLAY_DISMISS_HINT)
             )
 
     # Key handling
-    def _handle_key(self, stdscr: "curses.window", ch: int) -> bool:
+    def _handle_key(
+        self, stdscr: "curses.window", ch: int, now_ms: int
+    ) -> DirtyFlags:  # type: ignore[name-defined]
+        """Apply a key read at now_ms and return the screen regions it changed."""
+        if ch == curses.KEY_RESIZE:
+            # Every region moves with the terminal size; _draw rebuilds layout.
+            return DirtyFlags.ALL
+
         if self.state.help_visible:
-            return self._handle_help_key(stdscr, ch)
+            return _dirty_all_if(self._handle_help_key(stdscr, ch))
 
         # Overlays dismiss on any key
         if self.state.overlay in ("error", "message"):
             self.state.overlay = "none"
-            return True
+            return DirtyFlags.BODY
 
         # Leader handling
         if self.state.leader.active:
-            leader_handled = self._handle_leader_input(stdscr, ch)
-            if leader_handled is not None:
-                return leader_handled
+            leader_dirty = self._handle_leader_input(stdscr, ch, now_ms)
+            if leader_dirty is not None:
+                return leader_dirty
 
         if ch == KEY_LEADER:
             self.state.leader.active = True
             self.state.leader.sequence = ""
-            self.state.leader.started_at_ms = int(time.time() * 1000)
-            return True
+            self.state.leader.started_at_ms_mono = now_ms
+            return DirtyFlags.FOOTER
 
-        if ch == KEY_TAB:
-            self._cycle_agenda_bucket()
-            return True
+        # Any key other than d also cancels a pending dd.
+        handled_delete = self._handle_delete_key(ch, now_ms)
+        if handled_delete is not None:
+            return _dirty_all_if(handled_delete)
 
-        if ch == KEY_N:
-            return self._edit_or_create(stdscr, force_new=True)
+        action = self._GLOBAL_KEYS.get(ch)
+        if action is not None:
+            return action(self, stdscr)
 
-        if ch == KEY_A:
-            self._toggle_view()
-            return True
+        # View-specific navigation
+        if self.state.view == "agenda":
+            return self._handle_agenda_keys(ch)
+        return self._handle_month_keys(ch)
 
-        handled_delete = self._handle_delete_key(ch)
-        if handled_delete is not None:
-            return handled_delete
+    def _key_cycle_bucket(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        self._cycle_agenda_bucket()
+        return DirtyFlags.ALL
 
-        if ch == KEY_HELP:
-            self.state.help_visible = True
-            self.state.help_scroll = 0
-            return True
+    def _key_new_event(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        return _dirty_all_if(self._edit_or_create(stdscr, force_new=True))
 
-        if ch == KEY_ESC:
-            # Cancel overlays/leader or exit month events focus
-            handled = False
-            if self.state.view == "month" and self.state.month_focus == "events":
-                self.state.month_focus = "grid"
-                handled = True
-            self.state.overlay = "none"
-            self.state.leader.active = False
-            self.state.leader.sequence = ""
-            self.state.leader.started_at_ms = None
-            self._pending_delete["active"] = False
-            return True if handled or self.state.overlay == "none" else False
+    def _key_toggle_view(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        self._toggle_view()
+        return DirtyFlags.ALL
 
-        if ch == KEY_TODAY:
-            return self._jump_today()
+    def _key_show_help(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        self.state.help_visible = True
+        self.state.help_scroll = 0
+        return DirtyFlags.ALL
 
-        if ch == KEY_CAP_I:
-            if self.state.view == "agenda":
-                return self._edit_agenda_row_json(stdscr)
-            if self.state.view == "month" and self.state.month_focus == "events":
-                return self._edit_month_row_json(stdscr)
-            return False
+    def _key_escape(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        # Overlays and the leader already consumed Esc; only month events
+        # focus is left to exit.
+        if self.state.view == "month" and self.state.month_focus == "events":
+            self.state.month_focus = "grid"
+            return DirtyFlags.FOOTER | DirtyFlags.BODY
+        return DirtyFlags.NONE
 
-        if ch == KEY_I:
-            if self.state.view == "agenda":
-                visible = self._visible_agenda_events()
-                if not visible:
-                    return self._edit_or_create(stdscr, force_new=True)
-                return self._edit_agenda_cell(stdscr)
-            elif self.state.view == "month" and self.state.month_focus == "events":
-                if not self._month_events_for_selected_date():
-                    return self._edit_or_create(stdscr, force_new=True)
-                return self._edit_month_cell(stdscr)
-            else:
-                return False
+    def _key_jump_today(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        return DirtyFlags.BODY if self._jump_today() else DirtyFlags.NONE
 
-        if ch == ord("B"):
-            if self.state.view == "agenda":
-                return self._edit_agenda_bucket(stdscr)
-            if self.state.view == "month" and self.state.month_focus == "events":
-                return self._edit_month_bucket(stdscr)
-            return False
+    def _can_edit_row(self) -> bool:
+        # Row edits need a selected row: agenda, or month events focus.
+        return self.state.view == "agenda" or self.state.month_focus == "events"
 
-        # View-specific navigation
+    def _key_edit_row_json(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        if not self._can_edit_row():
+            return DirtyFlags.NONE
         if self.state.view == "agenda":
-            return self._handle_agenda_keys(ch)
-        else:
-            return self._handle_month_keys(ch)
+            return _dirty_all_if(self._edit_agenda_row_json(stdscr))
+        return _dirty_all_if(self._edit_month_row_json(stdscr))
+
+    def _key_edit_cell(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        if not self._can_edit_row():
+            return DirtyFlags.NONE
+        if self.state.view == "agenda":
+            if not self._visible_agenda_events():
+                return _dirty_all_if(self._edit_or_create(stdscr, force_new=True))
+            return _dirty_all_if(self._edit_agenda_cell(stdscr))
+        if not self._month_events_for_selected_date():
+            return _dirty_all_if(self._edit_or_create(stdscr, force_new=True))
+        return _dirty_all_if(self._edit_month_cell(stdscr))
+
+    def _key_edit_bucket(self, stdscr: "curses.window") -> DirtyFlags:  # type: ignore[name-defined]
+        if not self._can_edit_row():
+            return DirtyFlags.NONE
+        if self.state.view == "agenda":
+            return _dirty_all_if(self._edit_agenda_bucket(stdscr))
+        return _dirty_all_if(self._edit_month_bucket(stdscr))
+
+    _GLOBAL_KEYS: dict[int, Callable[["Orchestrator", "curses.window"], DirtyFlags]] = {
+        KEY_TAB: _key_cycle_bucket,
+        KEY_N: _key_new_event,
+        KEY_A: _key_toggle_view,
+        KEY_HELP: _key_show_help,
+        KEY_ESC: _key_escape,
+        KEY_TODAY: _key_jump_today,
+        KEY_CAP_I: _key_edit_row_json,
+        KEY_I: _key_edit_cell,
+        ord("B"): _key_edit_bucket,
+    }
 
     def _toggle_view(self) -> None:
         self.state.leader.active = False
-        self.state.leader.started_at_ms = None
+        self.state.leader.started_at_ms_mono = None
         self.state.leader.sequence = ""
         if self.state.view == "agenda":
             self.state.view = "month"
@@ -800,17 +1006,51 @@ class Orchestrator:
             self.state.view = "agenda"
             self._ensure_agenda_index_bounds(len(self._visible_agenda_events()))
 
-    def _maybe_timeout_leader(self, now_ms: int) -> None:
-        if self.state.leader.active and self.state.leader.started_at_ms:
-            if now_ms - self.state.leader.started_at_ms > LEADER_TIMEOUT_MS:
-                self.state.leader.active = False
-                self.state.leader.sequence = ""
-                self.state.leader.started_at_ms = None
+    def _next_timeout_ms(self) -> int | None:
+        """Earliest leader/delete deadline, or None when neither is pending."""
+        deadline: int | None = None
+        leader = self.state.leader
+        if leader.active and leader.started_at_ms_mono is not None:
+            deadline = leader.started_at_ms_mono + LEADER_TIMEOUT_MS
+        if self._pending_delete.active:
+            delete_deadline = self._pending_delete.started_at + DELETE_TIMEOUT_MS
+            if deadline is None or delete_deadline < deadline:
+                deadline = delete_deadline
+        return deadline
+
+    def _input_timeout_ms(self, now_ms: int, timeout_at: int | None) -> int:
+        """Block until the nearest pending deadline, or indefinitely when idle."""
+        deadlines: List[int] = [] if timeout_at is None else [timeout_at]
+        if self.state.dirty:
+            next_frame_ns = self._last_draw_ns + self._frame_budget_ns
+            deadlines.append(-(-next_frame_ns // 1_000_000))
+        if not deadlines:
+            return -1
+        # Timeouts fire once strictly past the deadline.
+        return max(0, min(deadlines) - now_ms + 1)
+
+    def _refresh_today(self, now_ms: int) -> None:
+        tick = now_ms // 1000
+        if tick == self._today_tick:
+            return
+        self._today_tick = tick
+        self._today = date.today()
 
-    def _maybe_timeout_delete(self, now_ms: int) -> None:
-        if self._pending_delete["active"]:
-            if now_ms - self._pending_delete["started_at"] > DELETE_TIMEOUT_MS:
-                self._pending_delete["active"] = False
+    def _fire_timeouts(self, now_ms: int) -> None:
+        """Expire whichever of the leader sequence and dd chord has lapsed."""
+        leader = self.state.leader
+        if (
+            leader.active
+            and leader.started_at_ms_mono is not None
+            and now_ms - leader.started_at_ms_mono > LEADER_TIMEOUT_MS
+        ):
+            leader.active = False
+            leader.sequence = ""
+            leader.started_at_ms_mono = None
+            self._mark_dirty(DirtyFlags.FOOTER)
+        pending = self._pending_delete
+        if pending.active and now_ms - pending.started_at > DELETE_TIMEOUT_MS:
+            pending.active = False
 
     def _handle_help_key(self, stdscr: "curses.window", ch: int) -> bool:  # type: ignore[name-defined]
         height, _ = stdscr.getmaxyx()
@@ -857,62 +1097,63 @@ class Orchestrator:
         return needs_redraw
 
     def _handle_leader_input(
-        self, stdscr: "curses.window", ch: int
-    ) -> bool | None:  # type: ignore[name-defined]
+        self, stdscr: "curses.window", ch: int, now_ms: int
+    ) -> DirtyFlags | None:  # type: ignore[name-defined]
+        """Advance the leader sequence; None lets the key fall through."""
         leader = self.state.leader
 
         if ch == KEY_ESC:
             leader.active = False
             leader.sequence = ""
-            leader.started_at_ms = None
-            return True
+            leader.started_at_ms_mono = None
+            return DirtyFlags.FOOTER
 
         if ch < 0 or ch > 255:
             leader.active = False
             leader.sequence = ""
-            leader.started_at_ms = None
-            return True
+            leader.started_at_ms_mono = None
+            return DirtyFlags.FOOTER
 
         char = chr(ch)
         sequence = leader.sequence + char
         leader.sequence = sequence
-        leader.started_at_ms = int(time.time() * 1000)
+        leader.started_at_ms_mono = now_ms
 
         if "conf".startswith(sequence):
             if sequence == "conf":
                 leader.active = False
                 leader.sequence = ""
-                leader.started_at_ms = None
-                return self._edit_config(stdscr)
-            return True
+                leader.started_at_ms_mono = None
+                return _dirty_all_if(self._edit_config(stdscr))
+            return DirtyFlags.FOOTER
 
         if sequence == "x":
-            return True
+            return DirtyFlags.FOOTER
 
         if sequence == "xa":
-            return True
+            return DirtyFlags.FOOTER
 
         if sequence == "xar":
             self.state.agenda_expand_all = True
             self.state.agenda_row_overrides.clear()
             leader.active = False
             leader.sequence = ""
-            leader.started_at_ms = None
-            return True
+            leader.started_at_ms_mono = None
+            return DirtyFlags.FOOTER | DirtyFlags.BODY
 
         if sequence == "xc":
             self.state.agenda_expand_all = False
             self.state.agenda_row_overrides.clear()
             leader.active = False
             leader.sequence = ""
-            leader.started_at_ms = None
-            return True
+            leader.started_at_ms_mono = None
+            return DirtyFlags.FOOTER | DirtyFlags.BODY
 
         if sequence == "xr":
             visible = self._visible_agenda_events()
             if visible:
                 idx = max(0, min(self.state.agenda_index, len(visible) - 1))
-                identity = self._event_identity(visible[idx])
+                identity = visible[idx].identity
                 overrides = self.state.agenda_row_overrides
                 if identity in overrides:
                     overrides.remove(identity)
@@ -920,32 +1161,33 @@ class Orchestrator:
                     overrides.add(identity)
             leader.active = False
             leader.sequence = ""
-            leader.started_at_ms = None
-            return True
+            leader.started_at_ms_mono = None
+            return DirtyFlags.FOOTER | DirtyFlags.BODY
 
         leader.active = False
         leader.sequence = ""
-        leader.started_at_ms = None
+        leader.started_at_ms_mono = None
+        # The key falls through, but the footer still drops the sequence.
+        self._mark_dirty(DirtyFlags.FOOTER)
         return None
 
-    def _handle_delete_key(self, ch: int) -> bool | None:
+    def _handle_delete_key(self, ch: int, now_ms: int) -> bool | None:
         if ch != KEY_D:
-            self._pending_delete["active"] = False
+            self._pending_delete.active = False
             return None
 
-        now_ms = int(time.time() * 1000)
         if (
-            self._pending_delete["active"]
-            and now_ms - self._pending_delete["started_at"] <= DELETE_TIMEOUT_MS
+            self._pending_delete.active
+            and now_ms - self._pending_delete.started_at <= DELETE_TIMEOUT_MS
         ):
             # Second 'd'
-            self._pending_delete["active"] = False
+            self._pending_delete.active = False
             return self._perform_delete()
 
         # First 'd'
-        self._pending_delete["active"] = True
-        self._pending_delete["started_at"] = now_ms
-        self._pending_delete["target_view"] = self.state.view
+        self._pending_delete.active = True
+        self._pending_delete.started_at = now_ms
+        self._pending_delete.target_view = self.state.view
         return False
 
     def _perform_delete(self) -> bool:
@@ -971,7 +1213,7 @@ class Orchestrator:
             self.state.overlay_message = f"Storage error: {exc}"
             return True
 
-        self.state.events = new_events
+        self._set_events(new_events)
         if self.state.view == "agenda":
             self._ensure_agenda_index_bounds(len(self._visible_agenda_events()))
         else:
@@ -983,200 +1225,169 @@ class Orchestrator:
         return True
 
     # Agenda behaviors
-    def _handle_agenda_keys(self, ch: int) -> bool:
-        visible = self._visible_agenda_events()
-        view = AgendaView(visible)
-        if ch == KEY_J:
-            self.state.agenda_index = view.move_selection(self.state.agenda_index, +1)
-            return True
-        if ch == KEY_K:
-            self.state.agenda_index = view.move_selection(self.state.agenda_index, -1)
-            return True
-        if ch == KEY_H:
-            self.state.agenda_col = view.clamp_column(self.state.agenda_col - 1)
-            return True
-        if ch == KEY_L:
-            self.state.agenda_col = view.clamp_column(self.state.agenda_col + 1)
-            return True
-        if ch == ord("H"):
-            return self._agenda_jump_day(-1)
-        if ch == ord("L"):
-            return self._agenda_jump_day(+1)
-        return False
-
-    def _agenda_jump_day(self, direction: int) -> bool:
-        visible = self._visible_agenda_events()
-        if not visible:
-            return False
-        cur_idx = max(0, min(self.state.agenda_index, len(visible) - 1))
-        cur_day = visible[cur_idx].jtbd.x.date()
-        if direction < 0:
-            for idx in range(cur_idx - 1, -1, -1):
-                if visible[idx].jtbd.x.date() < cur_day:
-                    target_day = visible[idx].jtbd.x.date()
-                    first_idx = next(
-                        (
-                            i
-                            for i, ev in enumerate(visible)
-                            if ev.jtbd.x.date() == target_day
-                        ),
-                        idx,
-                    )
-                    self.state.agenda_index = first_idx
-                    return True
-        else:
-            for idx in range(cur_idx + 1, len(visible)):
-                if visible[idx].jtbd.x.date() > cur_day:
-                    self.state.agenda_index = idx
-                    return True
-        return False
+    def _handle_agenda_keys(self, ch: int) -> DirtyFlags:
+        action = self._AGENDA_KEYS.get(ch)
+        return action(self) if action is not None else DirtyFlags.NONE
+
+    def _agenda_move_selection(self, delta: int) -> DirtyFlags:
+        prev_index = self.state.agenda_index
+        self.state.agenda_index = AgendaView.move_selection(
+            self.state.agenda_index, delta, len(self._visible_agenda_events())
+        )
+        if self.state.agenda_index == prev_index:
+            return DirtyFlags.NONE
+        return DirtyFlags.SELECTION
+
+    def _agenda_move_column(self, delta: int) -> DirtyFlags:
+        prev_col = self.state.agenda_col
+        self.state.agenda_col = AgendaView.clamp_column(self.state.agenda_col + delta)
+        if self.state.agenda_col == prev_col:
+            return DirtyFlags.NONE
+        return DirtyFlags.SELECTION
+
+    def _agenda_jump_day(self, direction: int) -> DirtyFlags:
+        target = self._get_agenda_view().jump_day(self.state.agenda_index, direction)
+        if target is None or target == self.state.agenda_index:
+            return DirtyFlags.NONE
+        self.state.agenda_index = target
+        return DirtyFlags.SELECTION
+
+    _AGENDA_KEYS: dict[int, Callable[["Orchestrator"], DirtyFlags]] = {
+        KEY_J: lambda self: self._agenda_move_selection(+1),
+        KEY_K: lambda self: self._agenda_move_selection(-1),
+        KEY_H: lambda self: self._agenda_move_column(-1),
+        KEY_L: lambda self: self._agenda_move_column(+1),
+        ord("H"): lambda self: self._agenda_jump_day(-1),
+        ord("L"): lambda self: self._agenda_jump_day(+1),
+    }
 
     # Month behaviors
-    def _handle_month_keys(self, ch: int) -> bool:
-        filtered_events = self._bucket_filtered_events()
-        view = MonthView(filtered_events)
+    def _handle_month_keys(self, ch: int) -> DirtyFlags:
         if self.state.month_focus == "grid":
-            if ch in (KEY_ENTER, curses.KEY_ENTER):
-                if self._month_events_for_selected_date():
-                    self.state.month_focus = "events"
-                    self.state.month_event_index = view.clamp_event_index(
-                        self.state.month_selected_date, self.state.month_event_index
-                    )
-                    self.state.month_event_col = max(
-                        0,
-                        min(
-                            self.state.month_event_col,
-                            MonthView.EVENT_COLUMN_COUNT - 1,
-                        ),
-                    )
-                    return True
-                return False
-            if ch == KEY_CTRL_H:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, -1
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_CTRL_L:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, +1
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_CTRL_K:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, -12
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_CTRL_J:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, +12
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_H:
-                self.state.month_selected_date = view.move_day(
-                    self.state.month_selected_date, -1
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_L:
-                self.state.month_selected_date = view.move_day(
-                    self.state.month_selected_date, +1
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_J:
-                self.state.month_selected_date = view.move_week(
-                    self.state.month_selected_date, +1
-                )
-                self.state.month_event_index = 0
-                return True
-            if ch == KEY_K:
-                self.state.month_selected_date = view.move_week(
-                    self.state.month_selected_date, -1
-                )
-                self.state.month_event_index = 0
-                return True
-        else:  # focus == events
-            if ch in (KEY_ENTER, curses.KEY_ENTER):
-                self.state.month_focus = "grid"
-                return True
-            if ch == KEY_H:
-                self.state.month_event_col = max(0, self.state.month_event_col - 1)
-                return True
-            if ch == KEY_L:
-                self.state.month_event_col = min(
-                    MonthView.EVENT_COLUMN_COUNT - 1,
-                    self.state.month_event_col + 1,
-                )
-                return True
-            if ch in (KEY_CTRL_H, KEY_CTRL_L, KEY_CTRL_J, KEY_CTRL_K):
-                self.state.month_focus = "grid"
-                self.state.month_event_index = 0
-                return self._handle_month_keys(ch)
-            if ch == KEY_CTRL_H:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, -1
-                )
-                self.state.month_event_index = 0
-                if not view.events_by_date.get(self.state.month_selected_date):
-                    self.state.month_focus = "grid"
-                return True
-            if ch == KEY_CTRL_L:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, +1
-                )
-                self.state.month_event_index = 0
-                if not view.events_by_date.get(self.state.month_selected_date):
-                    self.state.month_focus = "grid"
-                return True
-            if ch == KEY_CTRL_K:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, -12
-                )
-                self.state.month_event_index = 0
-                if not view.events_by_date.get(self.state.month_selected_date):
-                    self.state.month_focus = "grid"
-                return True
-            if ch == KEY_CTRL_J:
-                self.state.month_selected_date = view.move_month(
-                    self.state.month_selected_date, +12
-                )
-                self.state.month_event_index = 0
-                if not view.events_by_date.get(self.state.month_selected_date):
-                    self.state.month_focus = "grid"
-                return True
-            if ch == KEY_J:
-                self.state.month_event_index = view.clamp_event_index(
-                    self.state.month_selected_date, self.state.month_event_index + 1
-                )
-                return True
-            if ch == KEY_K:
-                self.state.month_event_index = view.clamp_event_index(
-                    self.state.month_selected_date, self.state.month_event_index - 1
-                )
-                return True
-        return False
+            action = self._MONTH_GRID_KEYS.get(ch)
+        else:
+            action = self._MONTH_EVENTS_KEYS.get(ch)
+        return action(self) if action is not None else DirtyFlags.NONE
+
+    def _month_enter_events(self) -> DirtyFlags:
+        if not self._month_events_for_selected_date():
+            return DirtyFlags.NONE
+        self.state.month_focus = "events"
+        self.state.month_event_index = MonthView.clamp_event_index(
+            self._month_events_by_date(),
+            self.state.month_selected_date,
+            self.state.month_event_index,
+        )
+        self.state.month_event_col = max(
+            0,
+            min(
+                self.state.month_event_col,
+                MonthView.EVENT_COLUMN_COUNT - 1,
+            ),
+        )
+        # The footer shows the focus, so it changes along with the body.
+        return DirtyFlags.FOOTER | DirtyFlags.BODY
+
+    def _month_leave_events(self) -> DirtyFlags:
+        self.state.month_focus = "grid"
+        return DirtyFlags.FOOTER | DirtyFlags.BODY
+
+    def _month_move_date(
+        self, move: Callable[[date, int], date], delta: int
+    ) -> DirtyFlags:
+        self.state.month_selected_date = move(self.state.month_selected_date, delta)
+        self.state.month_event_index = 0
+        return DirtyFlags.BODY
+
+    def _month_move_event(self, delta: int) -> DirtyFlags:
+        prev_index = self.state.month_event_index
+        self.state.month_event_index = MonthView.clamp_event_index(
+            self._month_events_by_date(),
+            self.state.month_selected_date,
+            self.state.month_event_index + delta,
+        )
+        if self.state.month_event_index == prev_index:
+            return DirtyFlags.NONE
+        return DirtyFlags.BODY
+
+    def _month_move_event_column(self, delta: int) -> DirtyFlags:
+        prev_col = self.state.month_event_col
+        self.state.month_event_col = max(
+            0,
+            min(MonthView.EVENT_COLUMN_COUNT - 1, self.state.month_event_col + delta),
+        )
+        if self.state.month_event_col == prev_col:
+            return DirtyFlags.NONE
+        return DirtyFlags.BODY
+
+    _MONTH_GRID_KEYS: dict[int, Callable[["Orchestrator"], DirtyFlags]] = {
+        KEY_ENTER: _month_enter_events,
+        curses.KEY_ENTER: _month_enter_events,
+        KEY_CTRL_H: lambda self: self._month_move_date(MonthView.move_month, -1),
+        KEY_CTRL_L: lambda self: self._month_move_date(MonthView.move_month, +1),
+        KEY_CTRL_K: lambda self: self._month_move_date(MonthView.move_month, -12),
+        KEY_CTRL_J: lambda self: self._month_move_date(MonthView.move_month, +12),
+        KEY_H: lambda self: self._month_move_date(MonthView.move_day, -1),
+        KEY_L: lambda self: self._month_move_date(MonthView.move_day, +1),
+        KEY_J: lambda self: self._month_move_date(MonthView.move_week, +1),
+        KEY_K: lambda self: self._month_move_date(MonthView.move_week, -1),
+    }
+
+    def _month_events_jump(self, ch: int) -> DirtyFlags:
+        # Month/year jumps leave the events list and act on the grid.
+        self.state.month_focus = "grid"
+        self.state.month_event_index = 0
+        return DirtyFlags.FOOTER | self._MONTH_GRID_KEYS[ch](self)
+
+    _MONTH_EVENTS_KEYS: dict[int, Callable[["Orchestrator"], DirtyFlags]] = {
+        KEY_ENTER: _month_leave_events,
+        curses.KEY_ENTER: _month_leave_events,
+        KEY_H: lambda self: self._month_move_event_column(-1),
+        KEY_L: lambda self: self._month_move_event_column(+1),
+        KEY_J: lambda self: self._month_move_event(+1),
+        KEY_K: lambda self: self._month_move_event(-1),
+        KEY_CTRL_H: lambda self: self._month_events_jump(KEY_CTRL_H),
+        KEY_CTRL_L: lambda self: self._month_events_jump(KEY_CTRL_L),
+        KEY_CTRL_K: lambda self: self._month_events_jump(KEY_CTRL_K),
+        KEY_CTRL_J: lambda self: self._month_events_jump(KEY_CTRL_J),
+    }
 
     # Jump to today
     def _jump_today(self) -> bool:
-        today = date.today()
+        today = self._today
         if self.state.view == "agenda":
+            prev = (self.state.agenda_index, self.state.agenda_scroll)
             visible = self._visible_agenda_events()
             if not visible:
                 self.state.agenda_index = 0
                 self.state.agenda_scroll = 0
-                return True
-            view = AgendaView(visible)
-            self.state.agenda_index = view.jump_to_today()
-            self._ensure_agenda_index_bounds(len(visible))
-            return True
+            else:
+                self.state.agenda_index = AgendaView.jump_to_today(visible)
+                self._ensure_agenda_index_bounds(len(visible))
+            return (self.state.agenda_index, self.state.agenda_scroll) != prev
         else:
+            changed = (
+                self.state.month_selected_date != today
+                or self.state.month_event_index != 0
+            )
             self.state.month_selected_date = today
             self.state.month_event_index = 0
-            return True
+            return changed
+
+    def _resume_curses(self, stdscr: "curses.window") -> None:  # type: ignore[name-defined]
+        """Restore curses after an external editor; the next _draw repaints."""
+        curses.reset_prog_mode()
+        # touchwin only flags every cell for output, so the screen is written
+        # once by _draw rather than repainted stale and then again.
+        stdscr.touchwin()
+        # The editor owned the terminal; rewrite the footer unconditionally.
+        self._last_footer = None
+        self._last_body_sig = None
+        self._mark_dirty(DirtyFlags.ALL)
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
 
     # Editing / creating
     def _edit_config(self, stdscr: "curses.window") -> bool:  # type: ignore[name-defined]
@@ -1191,11 +1402,7 @@ class Orchestrator:
                 )
                 return True
 
-        editor_cmd = os.environ.get("EDITOR", "vim")
-        try:
-            cmd = shlex.split(editor_cmd) if editor_cmd.strip() else ["vim"]
-        except ValueError:
-            cmd = ["vim"]
+        cmd = self._editor_argv
 
         curses.def_prog_mode()
         curses.endwin()
@@ -1214,14 +1421,7 @@ class Orchestrator:
                 if proc.returncode != 0:
                     cancelled = True
         finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+            self._resume_curses(stdscr)
 
         if error_message:
             self._show_overlay(stdscr, error_message, kind="error")
@@ -1236,6 +1436,14 @@ class Orchestrator:
     def _reload_config_from_disk(
         self, stdscr: "curses.window"
     ) -> bool:  # type: ignore[name-defined]
+        # The exit sync only covers the active service; flush this session's
+        # writes before it is replaced, since the data path may change.
+        try:
+            self.calendar.sync()
+        except StorageError as exc:
+            self._show_overlay(stdscr, f"Storage error: {exc}", kind="error")
+            return True
+
         new_config = load_config()
         new_calendar = CalendarService(new_config.data_csv_path)
         try:
@@ -1246,7 +1454,7 @@ class Orchestrator:
 
         self.config = new_config
         self.calendar = new_calendar
-        self.state.events = events
+        self._set_events(events)
         self._prune_row_overrides()
         self._ensure_agenda_index_bounds(len(self._visible_agenda_events()))
         month_events = self._month_events_for_selected_date()
@@ -1305,14 +1513,8 @@ class Orchestrator:
         # Exit curses before launching editor
         curses.def_prog_mode()
         curses.endwin()
-        editor_cmd = os.environ.get("EDITOR", "vim")
-        ok, result = edit_event_via_editor(editor_cmd, payload)
-        curses.reset_prog_mode()
-
-        stdscr.refresh()
-        curses.curs_set(0)
-        stdscr.nodelay(True)
-        stdscr.timeout(100)
+        ok, result = edit_event_via_editor(self._editor_cmd, payload)
+        self._resume_curses(stdscr)
 
         if not ok:
             # Editor failed or was cancelled; message already surfaced if needed.
@@ -1322,18 +1524,16 @@ class Orchestrator:
         originals: List[Event] = originals_source if allow_overwrite else []
 
         try:
-            new_events = self.state.events
+            updates: List[tuple[Event, tuple[bool, Event | None]]] = []
             for idx, ev in enumerate(updated_events):
                 original = originals[idx] if idx < len(originals) else None
-                new_events = self.calendar.upsert_event(
-                    new_events,
-                    ev,
-                    replace_dt=(original is not None, original),
-                )
+                updates.append((ev, (original is not None, original)))
+            new_events = self.calendar.upsert_events_bulk(self.state.events, updates)
+            for ev, (_, original) in updates:
                 if original is not None:
                     self._replace_row_override(original, ev)
-            self.state.events = new_events
-            self._pending_delete["active"] = False
+            self._set_events(new_events)
+            self._pending_delete.active = False
             # Rebuild any derived selection indices sensibly
             if self.state.view == "agenda":
                 if updated_events:
@@ -1357,7 +1557,6 @@ class Orchestrator:
         event = visible[idx]
         column = max(0, min(self.state.agenda_col, AgendaView.COLUMN_COUNT - 1))
         self.state.agenda_col = column
-        editor_cmd = os.environ.get("EDITOR", "vim")
 
         seed_value = ""
         if column == 0:
@@ -1371,19 +1570,7 @@ class Orchestrator:
         else:
             seed_value = ""
 
-        curses.def_prog_mode()
-        curses.endwin()
-        try:
-            ok, payload = self._launch_single_value_editor(editor_cmd, seed_value)
-        finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+        ok, payload = self._edit_single_value(stdscr, seed_value)
 
         if not ok:
             # Editor cancelled or failed; nothing to do.
@@ -1391,6 +1578,9 @@ class Orchestrator:
 
         if payload is None:
             return True
+        if payload == seed_value:
+            # Saved untouched; skip parsing the seed back.
+            return True
 
         updated_event = event
         if column == 0:
@@ -1444,7 +1634,7 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_agenda_event(updated_event)
         self._prune_row_overrides()
         return True
@@ -1456,21 +1646,15 @@ class Orchestrator:
 
         idx = max(0, min(self.state.agenda_index, len(visible) - 1))
         event = visible[idx]
-        editor_cmd = os.environ.get("EDITOR", "vim")
 
         curses.def_prog_mode()
         curses.endwin()
         try:
-            ok, contents, error = self._launch_json_editor(editor_cmd, _row_editor_seed(event))
+            ok, contents, error = self._launch_json_editor(
+                self._editor_argv, _row_editor_seed(event)
+            )
         finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+            self._resume_curses(stdscr)
 
         if not ok:
             if error:
@@ -1497,7 +1681,7 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_agenda_event(updated_event)
         self._prune_row_overrides()
         return True
@@ -1510,21 +1694,7 @@ class Orchestrator:
         idx = max(0, min(self.state.agenda_index, len(visible) - 1))
         event = visible[idx]
 
-        curses.def_prog_mode()
-        curses.endwin()
-        try:
-            ok, payload = self._launch_single_value_editor(
-                os.environ.get("EDITOR", "vim"), event.bucket
-            )
-        finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+        ok, payload = self._edit_single_value(stdscr, event.bucket)
 
         if not ok:
             # Editor cancelled or failed; nothing to report.
@@ -1532,20 +1702,19 @@ class Orchestrator:
 
         if payload is None:
             return True
+        if payload == event.bucket:
+            return True
 
         new_bucket = payload.strip().lower()
         if not new_bucket:
             return True
-        if new_bucket not in BUCKETS:
-            valid = ", ".join(BUCKETS)
+        bucket_name = CANONICAL_BUCKETS.get(new_bucket)
+        if bucket_name is None:
             self._show_overlay(
-                stdscr,
-                f"Invalid bucket '{new_bucket}'. Expected one of: {valid}",
-                kind="error",
+                stdscr, INVALID_BUCKET_MESSAGE.format(new_bucket), kind="error"
             )
             return True
 
-        bucket_name = cast(BucketName, new_bucket)
         if bucket_name == event.bucket:
             return True
 
@@ -1562,7 +1731,7 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_agenda_event(updated_event)
         self._prune_row_overrides()
         return True
@@ -1577,7 +1746,6 @@ class Orchestrator:
         max_column = MonthView.EVENT_COLUMN_COUNT - 1
         column = max(0, min(self.state.month_event_col, max_column))
         self.state.month_event_col = column
-        editor_cmd = os.environ.get("EDITOR", "vim")
 
         seed_value = ""
         if column == 0:
@@ -1591,22 +1759,13 @@ class Orchestrator:
         else:
             seed_value = ""
 
-        curses.def_prog_mode()
-        curses.endwin()
-        try:
-            ok, payload = self._launch_single_value_editor(editor_cmd, seed_value)
-        finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+        ok, payload = self._edit_single_value(stdscr, seed_value)
 
         if not ok or payload is None:
             return True
+        if payload == seed_value:
+            # Saved untouched; skip parsing the seed back.
+            return True
 
         updated_event = event
         if column == 0:
@@ -1656,7 +1815,7 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_month_event(updated_event)
         self._prune_row_overrides()
         return True
@@ -1668,21 +1827,15 @@ class Orchestrator:
 
         idx = max(0, min(self.state.month_event_index, len(events) - 1))
         event = events[idx]
-        editor_cmd = os.environ.get("EDITOR", "vim")
 
         curses.def_prog_mode()
         curses.endwin()
         try:
-            ok, contents, error = self._launch_json_editor(editor_cmd, _row_editor_seed(event))
+            ok, contents, error = self._launch_json_editor(
+                self._editor_argv, _row_editor_seed(event)
+            )
         finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+            self._resume_curses(stdscr)
 
         if not ok:
             if error:
@@ -1709,7 +1862,7 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_month_event(updated_event)
         self._prune_row_overrides()
         return True
@@ -1722,38 +1875,23 @@ class Orchestrator:
         idx = max(0, min(self.state.month_event_index, len(events) - 1))
         event = events[idx]
 
-        curses.def_prog_mode()
-        curses.endwin()
-        try:
-            ok, payload = self._launch_single_value_editor(
-                os.environ.get("EDITOR", "vim"), event.bucket
-            )
-        finally:
-            curses.reset_prog_mode()
-            stdscr.refresh()
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            stdscr.nodelay(True)
-            stdscr.timeout(100)
+        ok, payload = self._edit_single_value(stdscr, event.bucket)
 
         if not ok or payload is None:
             return True
+        if payload == event.bucket:
+            return True
 
         new_bucket = payload.strip().lower()
         if not new_bucket:
             return True
-        if new_bucket not in BUCKETS:
-            valid = ", ".join(BUCKETS)
+        bucket_name = CANONICAL_BUCKETS.get(new_bucket)
+        if bucket_name is None:
             self._show_overlay(
-                stdscr,
-                f"Invalid bucket '{new_bucket}'. Expected one of: {valid}",
-                kind="error",
+                stdscr, INVALID_BUCKET_MESSAGE.format(new_bucket), kind="error"
             )
             return True
 
-        bucket_name = cast(BucketName, new_bucket)
         if bucket_name == event.bucket:
             return True
 
@@ -1772,17 +1910,35 @@ class Orchestrator:
             return True
 
         self._replace_row_override(event, updated_event)
-        self.state.events = new_events
+        self._set_events(new_events)
         self._reselect_month_event(updated_event)
         self._prune_row_overrides()
         return True
 
+    def _edit_single_value(
+        self, stdscr: "curses.window", seed_value: str  # type: ignore[name-defined]
+    ) -> tuple[bool, str | None]:
+        if self.config.inline_edit and "\n" not in seed_value:
+            value = prompt_line(stdscr, "> ", seed_value)
+            # The prompt drew over the footer row.
+            self._last_footer = None
+            self._mark_dirty(DirtyFlags.FOOTER)
+            return value is not None, value
+
+        curses.def_prog_mode()
+        curses.endwin()
+        try:
+            return self._launch_single_value_editor(self._editor_argv, seed_value)
+        finally:
+            self._resume_curses(stdscr)
+
     def _launch_single_value_editor(
-        self, editor_cmd: str, seed_value: str
+        self, cmd: List[str], seed_value: str
     ) -> tuple[bool, str | None]:
-        cmd = shlex.split(editor_cmd) if editor_cmd and editor_cmd.strip() else ["vim"]
+        import tempfile
+
         with tempfile.NamedTemporaryFile(
-            "w+", suffix=".txt", delete=False, encoding="utf-8"
+            "w+", suffix=".txt", delete=False, encoding="utf-8", dir=scratch_dir()
         ) as tmp:
             tmp_path = Path(tmp.name)
             tmp.write(seed_value)
@@ -1811,11 +1967,12 @@ class Orchestrator:
                 pass
 
     def _launch_json_editor(
-        self, editor_cmd: str, seed_payload: dict[str, object]
+        self, cmd: List[str], seed_payload: dict[str, object]
     ) -> tuple[bool, str | None, str | None]:
-        cmd = shlex.split(editor_cmd) if editor_cmd and editor_cmd.strip() else ["vim"]
+        import tempfile
+
         with tempfile.NamedTemporaryFile(
-            "w+", suffix=".json", delete=False, encoding="utf-8"
+            "w+", suffix=".json", delete=False, encoding="utf-8", dir=scratch_dir()
         ) as tmp:
             tmp_path = Path(tmp.name)
             json.dump(seed_payload, tmp, indent=2)
@@ -1844,40 +2001,66 @@ class Orchestrator:
             except Exception:
                 pass
 
+    def _set_events(self, events: List[Event]) -> None:
+        self.state.events = events
+        self.state.events_version += 1
+
     def _visible_agenda_events(self) -> List[Event]:
         return self._bucket_filtered_events()
 
     def _bucket_filtered_events(self) -> List[Event]:
-        if self.state.agenda_bucket_filter == ALL_BUCKET:
+        """Events in the active bucket, filtered once per events_version."""
+        return self._get_agenda_view().events
+
+    def _sync_view_caches(self) -> None:
+        """Drop cached views once the events they were built from change."""
+        if self._view_cache_version != self.state.events_version:
+            self._view_cache_version = self.state.events_version
+            self._agenda_views.clear()
+            self._month_views.clear()
+
+    def _get_agenda_view(self) -> AgendaView:
+        """Return the agenda view for the active bucket, rebuilt only on change."""
+        self._sync_view_caches()
+        bucket = self.state.agenda_bucket_filter
+        view = self._agenda_views.get(bucket)
+        if view is None:
+            view = AgendaView(self._filter_events_by_bucket())
+            self._agenda_views[bucket] = view
+        return view
+
+    def _get_month_view(self) -> MonthView:
+        """Return the month view for the active bucket, rebuilt only on change."""
+        self._sync_view_caches()
+        bucket = self.state.agenda_bucket_filter
+        view = self._month_views.get(bucket)
+        if view is None:
+            view = MonthView(self._bucket_filtered_events())
+            self._month_views[bucket] = view
+        return view
+
+    def _filter_events_by_bucket(self) -> List[Event]:
+        bucket = self.state.agenda_bucket_filter
+        if bucket == ALL_BUCKET:
             return list(self.state.events)
-        return [
-            ev
-            for ev in self.state.events
-            if ev.bucket == self.state.agenda_bucket_filter
-        ]
+        return [ev for ev in self.state.events if ev.bucket == bucket]
 
     def _ensure_agenda_index_bounds(self, visible_length: int) -> None:
+        state = self.state
         if visible_length <= 0:
-            self.state.agenda_index = 0
-            self.state.agenda_scroll = 0
+            state.agenda_index = 0
+            state.agenda_scroll = 0
         else:
-            self.state.agenda_index = max(
-                0, min(self.state.agenda_index, visible_length - 1)
-            )
-            self.state.agenda_scroll = max(
-                0, min(self.state.agenda_scroll, visible_length - 1)
-            )
-        self.state.agenda_col = max(
-            0, min(self.state.agenda_col, AgendaView.COLUMN_COUNT - 1)
+            last = visible_length - 1
+            state.agenda_index = max(0, min(state.agenda_index, last))
+            state.agenda_scroll = max(0, min(state.agenda_scroll, last))
+        state.agenda_col = max(
+            0, min(state.agenda_col, AgendaView.COLUMN_COUNT - 1)
         )
 
     def _cycle_agenda_bucket(self) -> None:
-        options: List[str] = [ALL_BUCKET, *BUCKETS]
-        try:
-            current_idx = options.index(self.state.agenda_bucket_filter)
-        except ValueError:
-            current_idx = 0
-        new_filter = options[(current_idx + 1) % len(options)]
+        current_idx = _BUCKET_CYCLE_INDEX.get(self.state.agenda_bucket_filter, 0)
+        new_filter = BUCKET_CYCLE[(current_idx + 1) % len(BUCKET_CYCLE)]
         self.state.agenda_bucket_filter = new_filter
         self.state.agenda_index = 0
         self.state.agenda_scroll = 0
@@ -1885,27 +2068,22 @@ class Orchestrator:
         self.state.month_event_col = 0
         self._ensure_agenda_index_bounds(len(self._visible_agenda_events()))
 
-    @staticmethod
-    def _event_identity(event: Event) -> tuple:
-        return (
-            event.bucket,
-            event.jtbd.x,
-            event.jtbd.y,
-            event.jtbd.z,
-            event.nsm.p,
-            event.nsm.q,
-            event.nsm.r,
-        )
-
     def _reselect_agenda_event(self, target: Event) -> None:
-        visible = self._visible_agenda_events()
-        target_identity = self._event_identity(target)
-        for idx, ev in enumerate(visible):
-            if self._event_identity(ev) == target_identity:
-                self.state.agenda_index = idx
-                break
-        else:
-            self.state.agenda_index = 0 if visible else 0
+        view = self._get_agenda_view()
+        visible = view.events
+        target_identity = target.identity
+        target_day = target.jtbd.x.date()
+        self.state.agenda_index = 0
+        # Only rows on the target's day can match; start from the day index.
+        start = view.first_index_by_date.get(target_day)
+        if start is not None:
+            for idx in range(start, len(visible)):
+                ev = visible[idx]
+                if ev.jtbd.x.date() != target_day:
+                    break
+                if ev.identity == target_identity:
+                    self.state.agenda_index = idx
+                    break
         self._ensure_agenda_index_bounds(len(visible))
 
     def _reselect_month_event(self, target: Event) -> None:
@@ -1913,9 +2091,9 @@ class Orchestrator:
         if target_day != self.state.month_selected_date:
             self.state.month_selected_date = target_day
         events = self._month_events_for_selected_date()
-        identity = self._event_identity(target)
+        identity = target.identity
         for idx, ev in enumerate(events):
-            if self._event_identity(ev) == identity:
+            if ev.identity == identity:
                 self.state.month_event_index = idx
                 break
         else:
@@ -1927,24 +2105,24 @@ class Orchestrator:
         )
 
     def _prune_row_overrides(self) -> None:
-        valid = {self._event_identity(ev) for ev in self.state.events}
-        self.state.agenda_row_overrides.intersection_update(valid)
+        overrides = self.state.agenda_row_overrides
+        if not overrides:
+            return
+        overrides.intersection_update(ev.identity for ev in self.state.events)
 
     def _replace_row_override(self, old_event: Event | None, new_event: Event) -> None:
         if old_event is None:
             return
-        old_identity = self._event_identity(old_event)
+        old_identity = old_event.identity
         overrides = self.state.agenda_row_overrides
         if old_identity in overrides:
             overrides.remove(old_identity)
-            overrides.add(self._event_identity(new_event))
+            overrides.add(new_event.identity)
 
     def _seed_events_for_agenda(self, *, force_new: bool = False) -> List[Event]:
         visible = self._visible_agenda_events()
         if not force_new and visible and 0 <= self.state.agenda_index < len(visible):
             return [visible[self.state.agenda_index]]
-        today = date.today()
-        dt_str = f"{today.strftime('%Y-%m-%d')} {SEEDED_DEFAULT_TIME}"
         bucket_filter = self.state.agenda_bucket_filter
         bucket = (
             DEFAULT_BUCKET
@@ -1955,7 +2133,7 @@ class Orchestrator:
             Event(
                 bucket=bucket,
                 jtbd=JTBD(
-                    x=parse_datetime(dt_str),
+                    x=datetime.combine(self._today, SEEDED_DEFAULT_TIME),
                     y="",
                     z="",
                 ),
@@ -1976,12 +2154,11 @@ class Orchestrator:
                 if selected_only and 0 <= self.state.month_event_index < len(evs):
                     return [evs[self.state.month_event_index]]
                 return evs
-        dt_str = f"{sel_day.strftime('%Y-%m-%d')} {SEEDED_DEFAULT_TIME}"
         return [
             Event(
                 bucket=DEFAULT_BUCKET,
                 jtbd=JTBD(
-                    x=parse_datetime(dt_str),
+                    x=datetime.combine(sel_day, SEEDED_DEFAULT_TIME),
                     y="",
                     z="",
                 ),
@@ -1989,17 +2166,18 @@ class Orchestrator:
             )
         ]
 
+    def _month_events_by_date(self) -> dict[date, List[Event]]:
+        return self._get_month_view().events_by_date
+
     def _month_events_for_selected_date(self) -> List[Event]:
-        sel_day = self.state.month_selected_date
-        return [
-            e for e in self._bucket_filtered_events() if e.jtbd.x.date() == sel_day
-        ]
+        return self._month_events_by_date().get(self.state.month_selected_date, [])
 
     def _show_overlay(
         self, stdscr: "curses.window", message: str, kind: str = "error"
     ) -> None:  # type: ignore[name-defined]
         self.state.overlay = "error" if kind == "error" else "message"
         self.state.overlay_message = message
+        self._mark_dirty(DirtyFlags.OVERLAY)
         self._draw(stdscr)
 
 
@@ -15,8 +15,16 @@ def xdg_data_home() -> Path:
     return Path(os.environ.get("XDG_DATA_HOME", "~/.xyz")).expanduser()
 
 
+def scratch_dir() -> str | None:
+    """Return a RAM-backed directory for short-lived editor files, if any."""
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-__all__ = ["xdg_config_home", "xdg_data_home", "ensure_dir"]
+__all__ = ["xdg_config_home", "xdg_data_home", "scratch_dir", "ensure_dir"]
@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import Literal, Optional, List, Set, Tuple
+from datetime import date
+from enum import IntFlag
+from typing import Literal, Optional, List, Set
 
-from models import Event, ALL_BUCKET
+from models import Event, EventIdentity, ALL_BUCKET
 
 ViewName = Literal["agenda", "month"]
 
@@ -15,25 +16,52 @@ FocusName = Literal["grid", "events"]
 OverlayKind = Literal["none", "help", "error", "message"]
 
 
-@dataclass
+class DirtyFlags(IntFlag):
+    """Screen regions that need repainting; NONE is falsy."""
+
+    NONE = 0
+    FOOTER = 1
+    BODY = 2
+    OVERLAY = 4
+    # Only the agenda selection moved; the body may be patched in place.
+    SELECTION = 8
+    ALL = FOOTER | BODY | OVERLAY
+
+
+@dataclass(slots=True)
 class LeaderState:
     active: bool = False
-    started_at_ms: Optional[int] = None
+    # Monotonic clock (ms), immune to wall-clock adjustments.
+    started_at_ms_mono: Optional[int] = None
     sequence: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class PendingDelete:
+    """First press of a dd chord, awaiting the second within the timeout."""
+
+    active: bool = False
+    # Monotonic clock (ms) of the first press.
+    started_at: int = 0
+    target_view: ViewName = "agenda"
+
+
+@dataclass(slots=True)
 class AppState:
     view: ViewName = "month"
     leader: LeaderState = field(default_factory=LeaderState)
     overlay: OverlayKind = "none"
     overlay_message: str = ""
+    # Regions changed since the last draw that no key handler reported.
+    dirty: DirtyFlags = DirtyFlags.NONE
     focused_date: date = field(default_factory=lambda: date.today())
 
     help_visible: bool = False
     help_scroll: int = 0
 
     events: List[Event] = field(default_factory=list)
+    # Bumped whenever ``events`` is replaced; keys the view caches.
+    events_version: int = 0
 
     # Agenda selection
     agenda_index: int = 0
@@ -41,9 +69,7 @@ class AppState:
     agenda_expand_all: bool = True
     agenda_col: int = 0
     agenda_bucket_filter: str = ALL_BUCKET
-    agenda_row_overrides: Set[Tuple[str, datetime, str, str, float, float, float]] = field(
-        default_factory=set
-    )
+    agenda_row_overrides: Set[EventIdentity] = field(default_factory=set)
 
     # Month view
     month_focus: FocusName = "grid"
@@ -52,4 +78,12 @@ class AppState:
     month_event_col: int = 0
 
 
-__all__ = ["AppState", "LeaderState", "ViewName", "FocusName", "OverlayKind"]
+__all__ = [
+    "AppState",
+    "LeaderState",
+    "PendingDelete",
+    "ViewName",
+    "FocusName",
+    "OverlayKind",
+    "DirtyFlags",
+]
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import bisect
 import csv
-import tempfile
+import os
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Tuple, cast
+from typing import Iterable, List, Tuple
 
 
 from models import (
@@ -14,8 +17,7 @@ from models import (
     Event,
     JTBD,
     NorthStarMetrics,
-    BUCKETS,
-    BucketName,
+    CANONICAL_BUCKETS,
     parse_datetime,
 )
 
@@ -31,39 +33,84 @@ CSV_HEADER = [
 ]
 
 
+_ROW_WIDTH = len(CSV_HEADER)
+
+# Large stores are read and written in few syscalls instead of 8 KiB chunks.
+_IO_BUFFER_SIZE = 1 << 20
+
+
 class StorageError(Exception):
     pass
 
 
-def _serialize_event(event: Event) -> List[str]:
-    return [
+def _event_sort_key(
+    event: Event,
+) -> tuple[datetime, str, str, str, float, float, float]:
+    return (
+        event.jtbd.x,
         event.bucket,
-        event.jtbd.x.strftime(DATETIME_FMT),
         event.jtbd.y,
         event.jtbd.z,
-        str(event.nsm.p),
-        str(event.nsm.q),
-        str(event.nsm.r),
-    ]
+        event.nsm.p,
+        event.nsm.q,
+        event.nsm.r,
+    )
+
+
+@lru_cache(maxsize=65536)
+def _format_datetime(value: datetime) -> str:
+    # Every save re-serializes all rows; most datetimes were seen before.
+    return value.strftime(DATETIME_FMT)
+
+
+# Stored datetimes repeat heavily across rows and datetime is immutable, so
+# parsed values are shared between events.
+_parse_stored_datetime = lru_cache(maxsize=65536)(parse_datetime)
+
+
+def _csv_field(value: str) -> str:
+    """Quote ``value`` exactly as csv.writer's QUOTE_MINIMAL would."""
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return '"' + value + '"'
+    return value
+
+
+def _format_row(event: Event) -> str:
+    # bucket, datetime and float text never need quoting; only y and z are
+    # free text, so rows skip csv.writer's per-cell dispatch.
+    jtbd = event.jtbd
+    nsm = event.nsm
+    return (
+        f"{event.bucket},{_format_datetime(jtbd.x)},"
+        f"{_csv_field(jtbd.y)},{_csv_field(jtbd.z)},"
+        f"{nsm.p!s},{nsm.q!s},{nsm.r!s}\r\n"
+    )
+
+
+_HEADER_LINE = ",".join(CSV_HEADER) + "\r\n"
 
 
 def _deserialize_row(row: List[str]) -> Event:
-    if len(row) < len(CSV_HEADER):
-        raise StorageError("Corrupt CSV row")
-    (
-        raw_bucket,
-        dt_str,
-        outcome,
-        impact,
-        p_str,
-        q_str,
-        r_str,
-    ) = row[: len(CSV_HEADER)]
+    try:
+        (
+            raw_bucket,
+            dt_str,
+            outcome,
+            impact,
+            p_str,
+            q_str,
+            r_str,
+        ) = row[:_ROW_WIDTH]
+    except ValueError:
+        # Short rows fail the unpack; no separate length check per row.
+        raise StorageError("Corrupt CSV row") from None
 
     bucket = raw_bucket.strip().lower()
-    if bucket not in BUCKETS:
+    bucket_name = CANONICAL_BUCKETS.get(bucket)
+    if bucket_name is None:
         raise StorageError(f"Invalid bucket '{bucket}' in storage")
-    bucket_name = cast(BucketName, bucket)
 
     try:
         p_value = float(p_str)
@@ -75,7 +122,7 @@ def _deserialize_row(row: List[str]) -> Event:
     return Event(
         bucket=bucket_name,
         jtbd=JTBD(
-            x=parse_datetime(dt_str),
+            x=_parse_stored_datetime(dt_str),
             y=outcome,
             z=impact,
         ),
@@ -83,57 +130,88 @@ def _deserialize_row(row: List[str]) -> Event:
     )
 
 
+def _is_header(row: List[str]) -> bool:
+    normalized = [cell.strip().lower() for cell in row[: len(CSV_HEADER)]]
+    return normalized == CSV_HEADER
+
+
 def load_events(path: Path) -> List[Event]:
     if not path.exists():
         return []
     try:
-        with path.open(newline="", encoding="utf-8") as fh:
+        with path.open(newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fh:
             reader = csv.reader(fh)
             events: List[Event] = []
+            append = events.append
             for row in reader:
-                if not row or all(not cell.strip() for cell in row):
+                if not row:
                     continue
-                normalized = [cell.strip().lower() for cell in row]
-                if (
-                    len(normalized) >= len(CSV_HEADER)
-                    and normalized[: len(CSV_HEADER)] == CSV_HEADER
-                ):
-                    # Skip header row
+                # Only rows led by a blank or "bucket" cell can be skipped, so
+                # data rows avoid the full blank/header scans.
+                lead = row[0].strip().lower()
+                if not lead and all(not cell.strip() for cell in row):
                     continue
-                events.append(_deserialize_row(row))
+                if lead == CSV_HEADER[0] and _is_header(row):
+                    continue
+                append(_deserialize_row(row))
     except Exception as exc:  # noqa: BLE001
         raise StorageError(f"Failed to read events from {path}: {exc}") from exc
-    events.sort(key=lambda e: e.jtbd.x)
+    events.sort(key=_event_sort_key)
     return events
 
 
-def _write_atomic(path: Path, rows: Iterable[List[str]]) -> None:
+def _write_atomic(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        "w", newline="", delete=False, encoding="utf-8", dir=str(path.parent)
-    ) as tmp:
-        tmp_path = Path(tmp.name)
-        writer = csv.writer(tmp)
-        for row in rows:
-            writer.writerow(row)
-    tmp_path.replace(path)
+    # A pid-named sibling keeps concurrent writers (TUI and CLI) apart; 0600
+    # matches the mode tempfile used to give the store.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with open(
+            fd, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE
+        ) as fh:
+            fh.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _append_events(path: Path, events: Iterable[Event]) -> None:
+    """Append rows to an existing non-empty CSV in one write.
+
+    Rows land unsorted on disk; ``load_events`` sorts on read and the next
+    full save restores file order.
+    """
+    data = "".join(map(_format_row, events)).encode("utf-8")
+    with path.open("a+b") as fh:
+        fh.seek(-1, os.SEEK_END)
+        if fh.read(1) not in (b"\n", b"\r"):
+            data = b"\r\n" + data
+        fh.write(data)
 
 
 def save_events(path: Path, events: Iterable[Event]) -> None:
-    ordered = sorted(
-        events,
-        key=lambda e: (
-            e.jtbd.x,
-            e.bucket,
-            e.jtbd.y,
-            e.jtbd.z,
-            e.nsm.p,
-            e.nsm.q,
-            e.nsm.r,
-        ),
-    )
-    rows = [CSV_HEADER] + [_serialize_event(e) for e in ordered]
-    _write_atomic(path, rows)
+    _save_sorted_events(path, sorted(events, key=_event_sort_key))
+
+
+def _save_sorted_events(path: Path, events: List[Event]) -> None:
+    """Write ``events`` that are already in ``_event_sort_key`` order."""
+    _write_atomic(path, _HEADER_LINE + "".join(map(_format_row, events)))
+
+
+def _apply_upsert(
+    events: List[Event],
+    new_event: Event,
+    replace_dt: Tuple[bool, Event | None],
+) -> None:
+    editing, original = replace_dt
+    if editing and original is not None:
+        target = _event_sort_key(original)
+        idx = bisect.bisect_left(events, target, key=_event_sort_key)
+        if idx < len(events) and _event_sort_key(events[idx]) == target:
+            del events[idx]
+    bisect.insort(events, new_event, key=_event_sort_key)
 
 
 def upsert_event(
@@ -143,41 +221,87 @@ def upsert_event(
     *,
     replace_dt: Tuple[bool, Event | None] = (False, None),
 ) -> List[Event]:
-    editing, original = replace_dt
-    updated: List[Event] = []
+    """Insert ``new_event`` into the sorted ``events`` and persist the result.
+
+    ``events`` is expected in ``load_events`` order, so the edit is applied
+    in place of a full re-sort: drop the original, then bisect-insert.
+    """
+    return upsert_events_bulk(path, events, [(new_event, replace_dt)])
+
+
+def upsert_events_bulk(
+    path: Path,
+    events: List[Event],
+    updates: Iterable[Tuple[Event, Tuple[bool, Event | None]]],
+) -> List[Event]:
+    """Apply several ``upsert_event`` edits in memory and persist them once.
+
+    Pure inserts are appended to the file; edits rewrite it atomically.
+    """
+    updated = list(events)
+    inserted: List[Event] = []
     replaced = False
-    if editing and original is not None:
-        for e in events:
-            if (
-                not replaced
-                and e.bucket == original.bucket
-                and e.jtbd.x == original.jtbd.x
-                and e.jtbd.y == original.jtbd.y
-                and e.jtbd.z == original.jtbd.z
-                and e.nsm.p == original.nsm.p
-                and e.nsm.q == original.nsm.q
-                and e.nsm.r == original.nsm.r
-            ):
-                replaced = True
-                continue
-            updated.append(e)
+    for new_event, replace_dt in updates:
+        editing, original = replace_dt
+        if editing and original is not None:
+            replaced = True
+        else:
+            inserted.append(new_event)
+        _apply_upsert(updated, new_event, replace_dt)
+    if not replaced and not inserted:
+        return updated
+    if not replaced and _has_rows(path):
+        _append_events(path, inserted)
     else:
-        updated = list(events)
-    updated.append(new_event)
-    ordered = sorted(
-        updated,
-        key=lambda e: (
-            e.jtbd.x,
-            e.bucket,
-            e.jtbd.y,
-            e.jtbd.z,
-            e.nsm.p,
-            e.nsm.q,
-            e.nsm.r,
-        ),
-    )
-    save_events(path, ordered)
-    return ordered
+        _save_sorted_events(path, updated)
+    return updated
+
+
+def _has_rows(path: Path) -> bool:
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def delete_event(path: Path, events: List[Event], target: Event) -> List[Event]:
+    """Drop every event identical to ``target`` from sorted ``events`` and persist.
 
+    The sort key covers every field, so exact matches form one contiguous
+    run located by bisection.
+    """
+    key = _event_sort_key(target)
+    lo = bisect.bisect_left(events, key, key=_event_sort_key)
+    hi = bisect.bisect_right(events, key, lo=lo, key=_event_sort_key)
+    remaining = events[:lo] + events[hi:]
+    _save_sorted_events(path, remaining)
+    return remaining
 
-__all__ = ["load_events", "save_events", "upsert_event", "StorageError"]
+
+def sync_events(path: Path) -> None:
+    """fsync the CSV and its directory so earlier writes survive a crash.
+
+    Saves skip fsync; callers batch durability by syncing once, e.g. at exit.
+    """
+    try:
+        for target in (path, path.parent):
+            fd = os.open(target, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    except FileNotFoundError:
+        return
+    except OSError as exc:
+        raise StorageError(f"Failed to sync events to {path}: {exc}") from exc
+
+
+__all__ = [
+    "load_events",
+    "save_events",
+    "upsert_event",
+    "upsert_events_bulk",
+    "delete_event",
+    "sync_events",
+    "StorageError",
+]
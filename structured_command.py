@@ -10,7 +10,9 @@ from models import (
     NorthStarMetrics,
     ValidationError,
     parse_datetime,
+    format_metric,
     BUCKETS,
+    CANONICAL_BUCKETS,
     BucketName,
 )
 
@@ -40,22 +42,23 @@ class ParsedCommand:
     r: float
 
 
-_COMPONENT_RE = re.compile(r"(?i){label}\((.*?)\)")
-
-
-def _format_metric(value: float) -> str:
-    text = f"{value:.2f}"
-    if "." in text:
-        text = text.rstrip("0").rstrip(".")
-    return text
+_COMPONENT_LABELS = ("bucket", "x", "y", "z", "p", "q", "r")
+# One pass finds every label(...) block; text inside a matched block is not
+# rescanned for other labels.
+_COMPONENT_RE = re.compile(
+    rf"(?i)({'|'.join(_COMPONENT_LABELS)})\((.*?)\)", re.DOTALL
+)
 
 
-def _extract_component(text: str, label: str) -> str:
-    pattern = re.compile(rf"(?i){label}\\((.*?)\\)", re.DOTALL)
-    match = pattern.search(text)
-    if not match:
-        raise StructuredCommandError(f"Missing {label}(...) block")
-    return match.group(1).strip()
+def _extract_components(text: str) -> dict[str, str]:
+    components: dict[str, str] = {}
+    for match in _COMPONENT_RE.finditer(text):
+        # The first block for a label wins, as with a per-label search.
+        components.setdefault(match.group(1).lower(), match.group(2).strip())
+    for label in _COMPONENT_LABELS:
+        if label not in components:
+            raise StructuredCommandError(f"Missing {label}(...) block")
+    return components
 
 
 def parse_structured_command(text: str) -> Event:
@@ -64,13 +67,14 @@ def parse_structured_command(text: str) -> Event:
     if not text or not text.strip():
         raise StructuredCommandError("Command text is empty")
 
-    bucket_raw = _extract_component(text, "bucket")
-    x_raw = _extract_component(text, "x")
-    y_raw = _extract_component(text, "y")
-    z_raw = _extract_component(text, "z")
-    p_raw = _extract_component(text, "p")
-    q_raw = _extract_component(text, "q")
-    r_raw = _extract_component(text, "r")
+    components = _extract_components(text)
+    bucket_raw = components["bucket"]
+    x_raw = components["x"]
+    y_raw = components["y"]
+    z_raw = components["z"]
+    p_raw = components["p"]
+    q_raw = components["q"]
+    r_raw = components["r"]
 
     if not y_raw:
         raise StructuredCommandError("y(...) must include an outcome description")
@@ -78,7 +82,8 @@ def parse_structured_command(text: str) -> Event:
     bucket = bucket_raw.strip().lower()
     if not bucket:
         raise StructuredCommandError("bucket(...) cannot be empty")
-    if bucket not in BUCKETS:
+    bucket_name = CANONICAL_BUCKETS.get(bucket)
+    if bucket_name is None:
         valid = ", ".join(BUCKETS)
         raise StructuredCommandError(
             f"Invalid bucket '{bucket}'. Expected one of: {valid}"
@@ -97,7 +102,7 @@ def parse_structured_command(text: str) -> Event:
         raise StructuredCommandError("North star metrics must be numeric") from exc
 
     return Event(
-        bucket=bucket,  # type: ignore[arg-type]
+        bucket=bucket_name,
         jtbd=JTBD(x=dt, y=y_raw, z=z_raw),
         nsm=NorthStarMetrics(p=p_value, q=q_value, r=r_value),
     )
@@ -126,9 +131,9 @@ def format_event_as_command(event: Event) -> str:
         f"bucket({event.bucket}) — "
         f"when x({event.jtbd.x:%Y-%m-%d %H:%M:%S}) happens, "
         f"I want y({event.jtbd.y}) outcome, so I can z({event.jtbd.z}); "
-        f"p({_format_metric(event.nsm.p)}) "
-        f"q({_format_metric(event.nsm.q)}) "
-        f"r({_format_metric(event.nsm.r)})"
+        f"p({format_metric(event.nsm.p)}) "
+        f"q({format_metric(event.nsm.q)}) "
+        f"r({format_metric(event.nsm.r)})"
     )
 
 
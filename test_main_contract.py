@@ -1,4 +1,5 @@
 import importlib.util
+import json
 import os
 from dataclasses import replace
 from io import StringIO
@@ -98,6 +99,34 @@ class MainContractTests(unittest.TestCase):
                 MAIN_MODULE.CONFIG_BOOTSTRAP_TEXT,
             )
 
+    def test_direct_add_rejects_corrupt_store(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            data_path = temp_path / "event.csv"
+            corrupt = "bucket,x,y,z,p,q,r\nthing,2026-01-26 00:00:00,short\n"
+            data_path.write_text(corrupt, encoding="utf-8")
+            config_dir = temp_path / "config" / "xyz"
+            config_dir.mkdir(parents=True)
+            (config_dir / "config.json").write_text(
+                json.dumps({"data_csv_path": str(data_path)}), encoding="utf-8"
+            )
+            env = os.environ.copy()
+            env["XDG_CONFIG_HOME"] = str(temp_path / "config")
+            with patch.dict(os.environ, env, clear=True):
+                code, output = self._run_main(
+                    "a",
+                    "-x", "2026-01-27 09:00",
+                    "-y", "outcome",
+                    "-z", "impact",
+                    "-p", "7",
+                    "-q", "8",
+                    "-r", "6",
+                )
+
+            self.assertEqual(code, 1)
+            self.assertIn("Corrupt CSV row", output)
+            self.assertEqual(data_path.read_text(encoding="utf-8"), corrupt)
+
     def test_conf_rejects_extra_arguments(self) -> None:
         code, output = self._run_main("conf", "extra")
         self.assertEqual(code, 1)
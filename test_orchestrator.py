@@ -0,0 +1,52 @@
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+APP_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(APP_ROOT))
+
+from models import Event, JTBD, NorthStarMetrics  # noqa: E402
+from orchestrator import Orchestrator  # noqa: E402
+
+
+class OrchestratorTests(unittest.TestCase):
+    def test_config_reload_syncs_writes_to_previous_store(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            old_path = temp_path / "old.csv"
+            new_path = temp_path / "new.csv"
+            config_path = temp_path / "config" / "xyz" / "config.json"
+            config_path.parent.mkdir(parents=True)
+            config_path.write_text(
+                json.dumps({"data_csv_path": str(old_path)}), encoding="utf-8"
+            )
+            env = os.environ.copy()
+            env["XDG_CONFIG_HOME"] = str(temp_path / "config")
+            with patch.dict(os.environ, env, clear=True), patch(
+                "calendar_service.sync_events"
+            ) as sync_events:
+                orchestrator = Orchestrator()
+                event = Event(
+                    bucket="thing",
+                    jtbd=JTBD(x=datetime(2026, 1, 26, 9, 0), y="outcome", z="impact"),
+                    nsm=NorthStarMetrics(p=7.0, q=8.0, r=6.0),
+                )
+                orchestrator.calendar.upsert_event([], event)
+                config_path.write_text(
+                    json.dumps({"data_csv_path": str(new_path)}), encoding="utf-8"
+                )
+
+                orchestrator._reload_config_from_disk(None)
+
+            sync_events.assert_called_once_with(old_path)
+            self.assertEqual(orchestrator.calendar.data_path, new_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import csv
+from datetime import datetime
+import io
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+
+APP_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(APP_ROOT))
+
+import store  # noqa: E402
+from models import DATETIME_FMT, Event, JTBD, NorthStarMetrics  # noqa: E402
+
+
+def _event(x: str, y: str = "outcome", z: str = "impact") -> Event:
+    return Event(
+        bucket="thing",
+        jtbd=JTBD(x=datetime.strptime(x, "%Y-%m-%d %H:%M"), y=y, z=z),
+        nsm=NorthStarMetrics(p=7.0, q=8.0, r=6.5),
+    )
+
+
+class StoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "event.csv"
+
+    def _seed(self, *events: Event) -> list[Event]:
+        store.save_events(self.path, events)
+        return store.load_events(self.path)
+
+    def test_insert_appends_to_existing_file(self) -> None:
+        existing = self._seed(_event("2026-01-02 09:00"))
+        before = self.path.read_bytes()
+
+        updated = store.upsert_event(self.path, existing, _event("2026-01-01 09:00"))
+
+        after = self.path.read_bytes()
+        self.assertTrue(after.startswith(before))
+        self.assertIn(b"2026-01-01 09:00", after[len(before):])
+        self.assertEqual(store.load_events(self.path), updated)
+
+    def test_edit_rewrites_file_in_sorted_order(self) -> None:
+        existing = self._seed(_event("2026-01-02 09:00"), _event("2026-01-03 09:00"))
+        edited = _event("2026-01-01 09:00", y="moved")
+
+        updated = store.upsert_event(
+            self.path, existing, edited, replace_dt=(True, existing[1])
+        )
+
+        rows = list(csv.reader(io.StringIO(self.path.read_text(encoding="utf-8"))))
+        self.assertEqual(rows[0], store.CSV_HEADER)
+        self.assertEqual([row[1] for row in rows[1:]], [
+            "2026-01-01 09:00:00",
+            "2026-01-02 09:00:00",
+        ])
+        self.assertEqual(store.load_events(self.path), updated)
+
+    def test_insert_into_missing_file_writes_header(self) -> None:
+        store.upsert_event(self.path, [], _event("2026-01-01 09:00"))
+
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], ",".join(store.CSV_HEADER))
+        self.assertEqual(len(lines), 2)
+
+    def test_append_after_missing_trailing_newline(self) -> None:
+        self.path.write_text(
+            "bucket,x,y,z,p,q,r\nthing,2026-01-02 09:00:00,a,b,1,2,3",
+            encoding="utf-8",
+        )
+        existing = store.load_events(self.path)
+
+        store.upsert_event(self.path, existing, _event("2026-01-03 09:00"))
+
+        loaded = store.load_events(self.path)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0].jtbd.y, "a")
+        self.assertEqual(loaded[0].nsm.r, 3.0)
+
+    def test_replace_with_duplicates_drops_one_copy(self) -> None:
+        dup = _event("2026-01-02 09:00")
+        existing = self._seed(dup, dup, _event("2026-01-03 09:00"))
+        edited = _event("2026-01-02 09:00", y="edited")
+
+        updated = store.upsert_event(
+            self.path, existing, edited, replace_dt=(True, dup)
+        )
+
+        self.assertEqual([ev.jtbd.y for ev in updated], ["edited", "outcome", "outcome"])
+        self.assertEqual(store.load_events(self.path), updated)
+
+    def test_delete_drops_every_duplicate(self) -> None:
+        dup = _event("2026-01-02 09:00")
+        keep_before = _event("2026-01-02 09:00", y="another")
+        keep_after = _event("2026-01-03 09:00")
+        existing = self._seed(keep_after, dup, keep_before, dup)
+
+        remaining = store.delete_event(self.path, existing, dup)
+
+        self.assertEqual(remaining, [keep_before, keep_after])
+        self.assertEqual(store.load_events(self.path), remaining)
+
+    def test_quoting_roundtrips_and_matches_csv_writer(self) -> None:
+        tricky = [
+            ("comma, inside", 'say "hi"'),
+            ("line one\nline two", "crlf\r\nend"),
+            ("  leading spaces", "trailing  "),
+            ('"quoted", and\nmulti', ""),
+        ]
+        events = [
+            _event(f"2026-01-0{idx + 1} 09:00", y=y, z=z)
+            for idx, (y, z) in enumerate(tricky)
+        ]
+
+        store.save_events(self.path, events)
+
+        self.assertEqual(store.load_events(self.path), events)
+        expected = io.StringIO(newline="")
+        writer = csv.writer(expected)
+        writer.writerow(store.CSV_HEADER)
+        for ev in events:
+            writer.writerow([
+                ev.bucket,
+                ev.jtbd.x.strftime(DATETIME_FMT),
+                ev.jtbd.y,
+                ev.jtbd.z,
+                ev.nsm.p,
+                ev.nsm.q,
+                ev.nsm.r,
+            ])
+        with self.path.open(newline="", encoding="utf-8") as fh:
+            self.assertEqual(fh.read(), expected.getvalue())
+
+    def test_bulk_upsert_without_updates_leaves_file_alone(self) -> None:
+        text = "bucket,x,y,z,p,q,r\nthing,2026-01-02 09:00:00,a,b,1,2,3"
+        self.path.write_text(text, encoding="utf-8")
+        existing = store.load_events(self.path)
+
+        updated = store.upsert_events_bulk(self.path, existing, [])
+
+        self.assertEqual(updated, existing)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), text)
+
+        missing = self.path.with_name("missing.csv")
+        store.upsert_events_bulk(missing, [], [])
+        self.assertFalse(missing.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
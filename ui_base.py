@@ -4,11 +4,26 @@
 from __future__ import annotations
 
 import curses
-from typing import Iterable
+import os
+import sys
+from typing import Mapping, Sequence
 
 
 _BOX_COLOR_PAIR: int | None = None
 
+# DEC private mode 2026: the terminal holds output until the end marker.
+_SYNC_BEGIN = b"\x1b[?2026h"
+_SYNC_END = b"\x1b[?2026l"
+_SYNC_TERM_PREFIXES = (
+    "xterm-kitty",
+    "xterm-ghostty",
+    "foot",
+    "alacritty",
+    "contour",
+    "wezterm",
+)
+_SYNC_TERM_PROGRAMS = frozenset({"WezTerm", "iTerm.app", "ghostty", "contour"})
+
 
 def _box_color_attr() -> int:
     global _BOX_COLOR_PAIR
@@ -40,11 +55,10 @@ def draw_footer(stdscr: "curses.window", text: str) -> None:  # type: ignore[nam
     stdscr.addnstr(h - 1, 0, text.ljust(max(1, w - 1)), max(0, w - 1))
 
 
-def draw_centered_box(stdscr: "curses._CursesWindow", lines: Iterable[str]) -> None:  # type: ignore[name-defined]
+def draw_centered_box(stdscr: "curses._CursesWindow", lines: Sequence[str]) -> None:  # type: ignore[name-defined]
     h, w = stdscr.getmaxyx()
-    lines_list = list(lines)
-    win_h = min(len(lines_list) + 2, h - 2)
-    win_w = min(max(len(line) for line in lines_list) + 4, w - 2)
+    win_h = min(len(lines) + 2, h - 2)
+    win_w = min(max(len(line) for line in lines) + 4, w - 2)
     win_y = (h - win_h) // 2
     win_x = (w - win_w) // 2
     win = stdscr.derwin(win_h, win_w, win_y, win_x)
@@ -54,17 +68,18 @@ def draw_centered_box(stdscr: "curses._CursesWindow", lines: Iterable[str]) -> N
         win.attrset(attr)
     win.erase()
     win.border()
-    for idx, line in enumerate(lines_list, start=1):
-        if attr:
-            win.addnstr(idx, 2, line[: win_w - 4], win_w - 4, attr)
-        else:
-            win.addnstr(idx, 2, line[: win_w - 4], win_w - 4)
-    win.refresh()
+    max_w = win_w - 4
+    if max_w > 0:
+        # addnstr truncates to max_w; the attribute choice is made once.
+        attr_args = (attr,) if attr else ()
+        for idx, line in enumerate(lines, start=1):
+            win.addnstr(idx, 2, line, max_w, *attr_args)
+    win.noutrefresh()
 
 
 def draw_help_overlay(
     stdscr: "curses.window",  # type: ignore[name-defined]
-    lines: Iterable[str],
+    lines: Sequence[str],
     *,
     scroll: int = 0,
     footer: str = "",
@@ -78,8 +93,7 @@ def draw_help_overlay(
     if h <= 0 or w <= 0:
         return 0
 
-    lines_list = list(lines)
-    total = len(lines_list)
+    total = len(lines)
     max_visible = max(1, h - 1)
     max_scroll = max(0, total - max_visible)
     scroll = clamp(scroll, 0, max_scroll)
@@ -90,8 +104,8 @@ def draw_help_overlay(
     for y in range(h - 1):
         stdscr.addnstr(y, 0, blank_line, max(0, w - 1), dim_attr)
 
-    visible = lines_list[scroll : scroll + max_visible]
-    for row, line in enumerate(visible):
+    for row in range(min(max_visible, total - scroll)):
+        line = lines[scroll + row]
         stdscr.addnstr(row, 0, line.ljust(max(1, w - 1)), max(0, w - 1))
 
     draw_footer(stdscr, footer)
@@ -99,6 +113,106 @@ def draw_help_overlay(
     return scroll
 
 
+def build_lines_pad(lines: Sequence[str], width: int) -> "curses.window":  # type: ignore[name-defined]
+    """Pre-render static lines, padded to width, into a pad for reuse.
+
+    The pad has a spare column so writing the last cell never errors.
+    """
+    width = max(1, width)
+    pad = curses.newpad(max(1, len(lines)), width + 1)
+    for row, line in enumerate(lines):
+        pad.addnstr(row, 0, line.ljust(width), width)
+    return pad
+
+
+def supports_synchronized_output(environ: Mapping[str, str]) -> bool:
+    """Guess from TERM/TERM_PROGRAM whether the terminal honours mode 2026."""
+    if environ.get("TERM_PROGRAM", "") in _SYNC_TERM_PROGRAMS:
+        return True
+    return environ.get("TERM", "").startswith(_SYNC_TERM_PREFIXES)
+
+
+def doupdate_synchronized(enabled: bool) -> None:
+    """curses.doupdate(), bracketed as one synchronized frame when enabled."""
+    if not enabled:
+        curses.doupdate()
+        return
+    fd = sys.stdout.fileno()
+    os.write(fd, _SYNC_BEGIN)
+    try:
+        curses.doupdate()
+    finally:
+        os.write(fd, _SYNC_END)
+
+
+_PROMPT_ACCEPT = ("\n", "\r", curses.KEY_ENTER)
+_PROMPT_BACKSPACE = ("\x7f", "\b", curses.KEY_BACKSPACE)
+
+
+def prompt_line(
+    stdscr: "curses.window",  # type: ignore[name-defined]
+    label: str,
+    seed: str,
+) -> str | None:
+    """Edit ``seed`` on the footer row; return None when cancelled with Esc."""
+    h, w = stdscr.getmaxyx()
+    if w <= 1 or h <= 0:
+        return None
+    text = list(seed)
+    cursor = len(text)
+    stdscr.timeout(-1)
+    try:
+        curses.curs_set(1)
+    except curses.error:
+        pass
+    try:
+        while True:
+            width = max(1, w - 1 - len(label))
+            start = max(0, cursor - width + 1)
+            visible = "".join(text[start : start + width])
+            stdscr.addnstr(h - 1, 0, (label + visible).ljust(w - 1), w - 1)
+            stdscr.move(h - 1, min(w - 2, len(label) + cursor - start))
+            stdscr.refresh()
+            try:
+                ch = stdscr.get_wch()
+            except curses.error:
+                continue
+            if ch in _PROMPT_ACCEPT:
+                return "".join(text)
+            if ch == "\x1b":
+                return None
+            if ch in _PROMPT_BACKSPACE:
+                if cursor > 0:
+                    cursor -= 1
+                    del text[cursor]
+            elif ch == curses.KEY_DC:
+                if cursor < len(text):
+                    del text[cursor]
+            elif ch == curses.KEY_LEFT:
+                cursor = max(0, cursor - 1)
+            elif ch == curses.KEY_RIGHT:
+                cursor = min(len(text), cursor + 1)
+            elif ch in (curses.KEY_HOME, "\x01"):
+                cursor = 0
+            elif ch in (curses.KEY_END, "\x05"):
+                cursor = len(text)
+            elif ch == "\x15":
+                del text[:cursor]
+                cursor = 0
+            elif ch == curses.KEY_RESIZE:
+                h, w = stdscr.getmaxyx()
+                if w <= 1 or h <= 0:
+                    return None
+            elif isinstance(ch, str) and ch.isprintable():
+                text.insert(cursor, ch)
+                cursor += 1
+    finally:
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+
+
 def clamp(value: int, min_value: int, max_value: int) -> int:
     return max(min_value, min(value, max_value))
 
@@ -108,5 +222,9 @@ __all__ = [
     "draw_footer",
     "draw_centered_box",
     "draw_help_overlay",
+    "build_lines_pad",
+    "supports_synchronized_output",
+    "doupdate_synchronized",
+    "prompt_line",
     "clamp",
 ]
@@ -5,10 +5,14 @@ from __future__ import annotations
 
 import curses
 import textwrap
-from datetime import datetime
-from typing import List, Sequence
-
-from models import Event
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+from models import Event, EventIdentity
 from ui_base import clamp
 
 _TIMESTAMP_FMT = "%Y-%m-%d %H:%M"
@@ -22,17 +26,31 @@ _MIN_NSM_WIDTH = 6
 _MAX_NSM_WIDTH = 12
 _GAP_WIDTH = 1
 _NO_TASKS_MESSAGE = "No tasks yet. Press i to create."
+_DATA_TOP = 1
 
 
 def _max_line_length(text: str) -> int:
     if not text:
         return 0
+    # Line separators are all non-printable, so printable text is one line.
+    if text.isprintable():
+        return len(text)
     lines = text.splitlines()
     if not lines:
         return len(text)
     return max(len(line) for line in lines)
 
 
+@lru_cache(maxsize=64)
+def _wrapper_for(width: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(
+        width=width,
+        break_long_words=True,
+        drop_whitespace=False,
+        replace_whitespace=False,
+    )
+
+
 def _wrap_text(value: str, width: int) -> List[str]:
     if width <= 0:
         return [""]
@@ -43,13 +61,11 @@ def _wrap_text(value: str, width: int) -> List[str]:
         if part == "":
             lines.append("")
             continue
-        wrapped = textwrap.wrap(
-            part,
-            width=width,
-            break_long_words=True,
-            drop_whitespace=False,
-            replace_whitespace=False,
-        )
+        if len(part) <= width and "\t" not in part:
+            # textwrap would return the part unchanged; skip its tokenizer.
+            lines.append(part)
+            continue
+        wrapped = _wrapper_for(width).wrap(part)
         if not wrapped:
             lines.append("")
         else:
@@ -57,28 +73,71 @@ def _wrap_text(value: str, width: int) -> List[str]:
     return lines or [""]
 
 
-def _event_identity(
-    event: Event,
-) -> tuple[str, datetime, str, str, float, float, float]:
-    return (
-        event.bucket,
-        event.jtbd.x,
-        event.jtbd.y,
-        event.jtbd.z,
-        event.nsm.p,
-        event.nsm.q,
-        event.nsm.r,
-    )
+# Shared across views, so an edit (which rebuilds the view) only re-measures
+# and re-wraps changed cells. Wrapped lists are shared; do not mutate them.
+_wrap_cached = lru_cache(maxsize=65536)(_wrap_text)
+_max_line_length_cached = lru_cache(maxsize=65536)(_max_line_length)
+
+
+def _event_time(event: Event) -> datetime:
+    return event.jtbd.x
 
 
 def _format_nsm_value(event: Event) -> str:
-    score = (event.nsm.p + event.nsm.q + event.nsm.r) / 30.0
+    return _format_nsm_score(event.nsm.p, event.nsm.q, event.nsm.r)
+
+
+# Timestamps and scores repeat across events and survive view rebuilds, so
+# both are formatted once per distinct value.
+@lru_cache(maxsize=65536)
+def _format_timestamp(value: datetime) -> str:
+    return value.strftime(_TIMESTAMP_FMT)
+
+
+@lru_cache(maxsize=4096)
+def _format_nsm_score(p: float, q: float, r: float) -> str:
+    score = (p + q + r) / 30.0
     text = f"{score:.2f}"
     if "." in text:
         text = text.rstrip("0").rstrip(".")
     return text
 
 
+# One agenda row: timestamp, wrapped y lines, wrapped z lines, nsm score.
+_Row = Tuple[str, List[str], List[str], str]
+
+
+def _line_cells(row: _Row, line_offset: int) -> Tuple[str, str, str, str]:
+    timestamp, y_lines, z_lines, nsm = row
+    if line_offset == 0:
+        return timestamp, y_lines[0], z_lines[0], nsm
+    return (
+        "",
+        y_lines[line_offset] if line_offset < len(y_lines) else "",
+        z_lines[line_offset] if line_offset < len(z_lines) else "",
+        "",
+    )
+
+
+@dataclass
+class _Frame:
+    """Layout and row positions from the last AgendaView.render()."""
+
+    size: tuple[int, int]
+    usable_h: int
+    usable_w: int
+    starts: List[int]
+    widths: List[int]
+    tail_width: int
+    rows: List[_Row] = field(default_factory=list)
+    row_heights: List[int] = field(default_factory=list)
+    row_offsets: List[int] = field(default_factory=list)
+    data_height: int = 0
+    scroll: int = 0
+    selected_idx: int = 0
+    row_y: Dict[int, int] = field(default_factory=dict)
+
+
 class AgendaView:
     COLUMN_COUNT = 4
     _HEADERS: Sequence[str] = ("x", "y", "z", "nsm")
@@ -98,6 +157,53 @@ class AgendaView:
 
     def __init__(self, events: List[Event]):
         self.events = events
+        # Events arrive sorted by time, so first-seen order is chronological.
+        self.first_index_by_date: Dict[date, int] = {}
+        for idx, ev in enumerate(events):
+            self.first_index_by_date.setdefault(ev.jtbd.x.date(), idx)
+        self.sorted_dates: List[date] = list(self.first_index_by_date)
+        self._frame: _Frame | None = None
+        # Cell text depends only on the events, wrapping only on column widths;
+        # both are reused across renders of this view.
+        self._samples: Tuple[List[str], ...] | None = None
+        self._column_lengths: List[int] = []
+        self._wrap_widths: Tuple[int, int] | None = None
+        self._wrapped: List[Tuple[List[str], List[str]]] = []
+
+    def _column_samples(self) -> Tuple[List[str], ...]:
+        if self._samples is None:
+            timestamps: List[str] = []
+            y_values: List[str] = []
+            z_values: List[str] = []
+            nsm_values: List[str] = []
+            max_x = max_y = max_z = max_nsm = 0
+            for ev in self.events:
+                jtbd = ev.jtbd
+                ts = _format_timestamp(jtbd.x)
+                nsm = _format_nsm_value(ev)
+                timestamps.append(ts)
+                y_values.append(jtbd.y)
+                z_values.append(jtbd.z)
+                nsm_values.append(nsm)
+                max_x = max(max_x, len(ts))
+                max_y = max(max_y, _max_line_length_cached(jtbd.y))
+                max_z = max(max_z, _max_line_length_cached(jtbd.z))
+                max_nsm = max(max_nsm, len(nsm))
+            self._samples = (timestamps, y_values, z_values, nsm_values)
+            self._column_lengths = [max_x, max_y, max_z, max_nsm]
+        return self._samples
+
+    def _wrapped_cells(
+        self, y_width: int, z_width: int
+    ) -> List[Tuple[List[str], List[str]]]:
+        if self._wrap_widths != (y_width, z_width):
+            _, y_values, z_values, _ = self._column_samples()
+            self._wrapped = [
+                (_wrap_cached(y_val, y_width), _wrap_cached(z_val, z_width))
+                for y_val, z_val in zip(y_values, z_values)
+            ]
+            self._wrap_widths = (y_width, z_width)
+        return self._wrapped
 
     def render(
         self,
@@ -107,8 +213,9 @@ class AgendaView:
         *,
         expand_all: bool = True,
         selected_col: int = 0,
-        row_overrides: set[tuple] | None = None,
+        row_overrides: set[EventIdentity] | None = None,
     ) -> int:  # type: ignore[name-defined]
+        self._frame = None
         h, w = stdscr.getmaxyx()
         usable_h = h - 1
         usable_w = max(0, w - 1)
@@ -121,25 +228,8 @@ class AgendaView:
         selected_col = clamp(selected_col, 0, self.COLUMN_COUNT - 1)
         row_overrides = row_overrides or set()
 
-        timestamps = [ev.jtbd.x.strftime(_TIMESTAMP_FMT) for ev in self.events]
-        y_values = [ev.jtbd.y for ev in self.events]
-        z_values = [ev.jtbd.z for ev in self.events]
-        nsm_values = [_format_nsm_value(ev) for ev in self.events]
-
-        column_samples: Sequence[Sequence[str]] = (
-            timestamps,
-            y_values,
-            z_values,
-            nsm_values,
-        )
-
-        column_lengths: List[int] = []
-        for idx, samples in enumerate(column_samples):
-            if idx == 1 or idx == 2:
-                max_len = max((_max_line_length(val) for val in samples), default=0)
-            else:
-                max_len = max((len(val) for val in samples), default=0)
-            column_lengths.append(max_len)
+        timestamps, _, _, nsm_values = self._column_samples()
+        column_lengths = self._column_lengths
 
         widths: List[int] = []
         for idx in range(self.COLUMN_COUNT):
@@ -195,38 +285,20 @@ class AgendaView:
             current_x += width + _GAP_WIDTH
         tail_width = max(0, usable_w - (starts[-1] + widths[-1]))
 
-        def write(
-            y: int,
-            x: int,
-            width: int,
-            text: str,
-            attr: int = 0,
-            align: str = "left",
-        ) -> None:
-            if width <= 0 or y < 0 or y >= usable_h:
-                return
-            if x >= usable_w:
-                return
-            span = min(width, max(0, usable_w - x))
-            if span <= 0:
-                return
-            try:
-                raw = text or ""
-                if len(raw) > span:
-                    raw = raw[-span:] if align == "right" else raw[:span]
-                if align == "right":
-                    padded = raw.rjust(span)
-                elif align == "center":
-                    padded = raw.center(span)
-                else:
-                    padded = raw.ljust(span)
-                stdscr.addnstr(y, x, padded, span, attr)
-            except curses.error:
-                pass
+        frame = _Frame(
+            size=(h, w),
+            usable_h=usable_h,
+            usable_w=usable_w,
+            starts=starts,
+            widths=widths,
+            tail_width=tail_width,
+        )
 
         header_y = 0
         for idx, header in enumerate(self._HEADERS):
-            write(
+            self._write(
+                stdscr,
+                frame,
                 header_y,
                 starts[idx],
                 widths[idx],
@@ -235,7 +307,9 @@ class AgendaView:
                 align=self._ALIGNMENTS[idx],
             )
             if idx < self.COLUMN_COUNT - 1:
-                write(
+                self._write(
+                    stdscr,
+                    frame,
                     header_y,
                     starts[idx] + widths[idx],
                     _GAP_WIDTH,
@@ -243,9 +317,16 @@ class AgendaView:
                     curses.A_BOLD,
                 )
         if tail_width > 0:
-            write(header_y, starts[-1] + widths[-1], tail_width, "", curses.A_BOLD)
+            self._write(
+                stdscr,
+                frame,
+                header_y,
+                starts[-1] + widths[-1],
+                tail_width,
+                "",
+                curses.A_BOLD,
+            )
 
-        data_top = 1
         data_height = usable_h - 1
         if data_height <= 0:
             return (
@@ -253,157 +334,250 @@ class AgendaView:
             )
 
         if not self.events:
-            write(data_top, 0, usable_w, _NO_TASKS_MESSAGE[:usable_w])
+            self._write(
+                stdscr, frame, _DATA_TOP, 0, usable_w, _NO_TASKS_MESSAGE[:usable_w]
+            )
             return 0
 
-        rows = []
+        wrapped = self._wrapped_cells(widths[1], widths[2])
+        rows: List[_Row] = []
+        row_heights: List[int] = []
         for idx, event in enumerate(self.events):
-            identity = _event_identity(event)
+            identity = event.identity
             if expand_all:
                 is_expanded = identity not in row_overrides
             else:
                 is_expanded = identity in row_overrides
 
-            y_lines_full = _wrap_text(y_values[idx], widths[1])
-            z_lines_full = _wrap_text(z_values[idx], widths[2])
+            y_lines_full, z_lines_full = wrapped[idx]
             y_lines = y_lines_full if is_expanded else y_lines_full[:1]
             z_lines = z_lines_full if is_expanded else z_lines_full[:1]
             y_lines = y_lines or [""]
             z_lines = z_lines or [""]
 
-            columns = [
-                [timestamps[idx]],
-                y_lines,
-                z_lines,
-                [nsm_values[idx]],
-            ]
-            height = max(len(lines) for lines in columns)
-            rows.append(
-                {
-                    "identity": identity,
-                    "columns": columns,
-                    "height": max(1, height),
-                }
-            )
+            rows.append((timestamps[idx], y_lines, z_lines, nsm_values[idx]))
+            row_heights.append(max(len(y_lines), len(z_lines)))
+
+        frame.rows = rows
+        frame.row_heights = row_heights
+        frame.row_offsets = list(accumulate(frame.row_heights, initial=0))
+        frame.data_height = data_height
 
         total_rows = len(rows)
         selected_idx = clamp(selected_idx, 0, total_rows - 1)
-        scroll = clamp(scroll, 0, total_rows - 1)
-
-        row_heights = [row["height"] for row in rows]
-
-        def compute_visible(start_idx: int) -> List[int]:
-            if start_idx < 0:
-                start_idx = 0
-            visible: List[int] = []
-            used = 0
-            idx = start_idx
-            while idx < total_rows:
-                height = max(1, row_heights[idx])
-                if used + height > data_height:
-                    if not visible:
-                        visible.append(idx)
-                    break
-                visible.append(idx)
-                used += height
-                if used >= data_height:
-                    break
-                idx += 1
-            return visible
+        scroll, visible = self._resolve_scroll(frame, selected_idx)
 
-        if scroll > selected_idx:
-            scroll = selected_idx
+        y_cursor = _DATA_TOP
+        data_bottom = _DATA_TOP + data_height
 
-        visible = compute_visible(scroll)
-        while selected_idx not in visible and scroll < total_rows - 1:
-            scroll += 1
-            visible = compute_visible(scroll)
-
-        if selected_idx not in visible:
-            scroll = selected_idx
-            visible = compute_visible(scroll)
+        for idx in visible:
+            frame.row_y[idx] = y_cursor
+            y_cursor = self._draw_row(
+                stdscr, frame, idx, y_cursor, selected_idx, selected_col
+            )
+            if y_cursor >= data_bottom:
+                break
 
-        def _height_sum(indices: List[int]) -> int:
-            return sum(row_heights[i] for i in indices)
+        frame.scroll = scroll
+        frame.selected_idx = selected_idx
+        self._frame = frame
+        return scroll
 
-        while scroll > 0:
-            prev_visible = compute_visible(scroll - 1)
-            if selected_idx not in prev_visible:
-                break
-            if _height_sum(prev_visible) > data_height:
-                break
-            scroll -= 1
-            visible = prev_visible
+    def repaint_selection(
+        self,
+        stdscr: "curses.window",  # type: ignore[name-defined]
+        selected_idx: int,
+        selected_col: int,
+    ) -> int | None:
+        """Patch the previous and new selected rows in place.
+
+        Returns the scroll offset, or None when the last render cannot be
+        reused (no render yet, resized, or the viewport would scroll) and the
+        caller must do a full render.
+        """
+        frame = self._frame
+        if frame is None or not frame.rows or stdscr.getmaxyx() != frame.size:
+            return None
+        selected_idx = clamp(selected_idx, 0, len(frame.rows) - 1)
+        selected_col = clamp(selected_col, 0, self.COLUMN_COUNT - 1)
+        scroll, _ = self._resolve_scroll(frame, selected_idx)
+        if scroll != frame.scroll or selected_idx not in frame.row_y:
+            return None
+        for idx in {frame.selected_idx, selected_idx}:
+            y = frame.row_y.get(idx)
+            if y is not None:
+                self._draw_row(stdscr, frame, idx, y, selected_idx, selected_col)
+        frame.selected_idx = selected_idx
+        return scroll
 
-        if not visible:
-            visible = [selected_idx]
+    @staticmethod
+    def _resolve_scroll(
+        frame: "_Frame", selected_idx: int
+    ) -> tuple[int, List[int]]:
+        # The viewport starts at the earliest row that still keeps the
+        # selection on screen; row_offsets makes both ends a bisect.
+        offsets = frame.row_offsets
+        data_height = frame.data_height
+        selected_idx = clamp(selected_idx, 0, len(frame.row_heights) - 1)
+        scroll = bisect_left(offsets, offsets[selected_idx + 1] - data_height)
+        if scroll > selected_idx:
+            # The selected row alone is taller than the viewport.
             scroll = selected_idx
+        end = bisect_right(offsets, offsets[scroll] + data_height) - 1
+        return scroll, list(range(scroll, max(end, scroll + 1)))
 
-        y_cursor = data_top
-        data_bottom = data_top + data_height
-
-        for idx in visible:
-            row = rows[idx]
-            row_lines = max(1, row["height"])
-            columns = row["columns"]
-            attrs = [
-                curses.A_REVERSE if (idx == selected_idx and selected_col == col_idx) else 0
-                for col_idx in range(self.COLUMN_COUNT)
-            ]
+    def _draw_row(
+        self,
+        stdscr: "curses.window",  # type: ignore[name-defined]
+        frame: "_Frame",
+        idx: int,
+        y_cursor: int,
+        selected_idx: int,
+        selected_col: int,
+    ) -> int:
+        row = frame.rows[idx]
+        row_lines = max(1, frame.row_heights[idx])
+        starts = frame.starts
+        widths = frame.widths
+        data_bottom = _DATA_TOP + frame.data_height
+        attrs = [0] * self.COLUMN_COUNT
+        if idx == selected_idx and 0 <= selected_col < self.COLUMN_COUNT:
+            attrs[selected_col] = curses.A_REVERSE
+
+        for line_offset in range(row_lines):
+            if y_cursor >= data_bottom:
+                break
 
-            for line_offset in range(row_lines):
-                if y_cursor >= data_bottom:
-                    break
+            cells = _line_cells(row, line_offset)
+            if idx != selected_idx:
+                # Unselected lines share one attribute, so draw them as a
+                # single pre-padded string instead of one call per segment.
+                line = self._compose_line(frame, cells)
+                # Wide characters and control characters (drawn as two-cell
+                # ^X) would shift later columns; keep those on the
+                # per-segment path, which places each column by x.
+                if line.isascii() and line.isprintable():
+                    try:
+                        stdscr.addnstr(y_cursor, 0, line, frame.usable_w)
+                    except curses.error:
+                        pass
+                    y_cursor += 1
+                    continue
 
-                for col_idx in range(self.COLUMN_COUNT):
-                    column_lines = columns[col_idx]
-                    text = (
-                        column_lines[line_offset]
-                        if line_offset < len(column_lines)
-                        else ""
-                    )
-                    write(
+            for col_idx, text in enumerate(cells):
+                self._write(
+                    stdscr,
+                    frame,
+                    y_cursor,
+                    starts[col_idx],
+                    widths[col_idx],
+                    text,
+                    attrs[col_idx],
+                    align=self._ALIGNMENTS[col_idx],
+                )
+                if col_idx < self.COLUMN_COUNT - 1:
+                    self._write(
+                        stdscr,
+                        frame,
                         y_cursor,
-                        starts[col_idx],
-                        widths[col_idx],
-                        text,
+                        starts[col_idx] + widths[col_idx],
+                        _GAP_WIDTH,
+                        " " * _GAP_WIDTH,
                         attrs[col_idx],
-                        align=self._ALIGNMENTS[col_idx],
                     )
-                    if col_idx < self.COLUMN_COUNT - 1:
-                        write(
-                            y_cursor,
-                            starts[col_idx] + widths[col_idx],
-                            _GAP_WIDTH,
-                            " " * _GAP_WIDTH,
-                            attrs[col_idx],
-                        )
-                if tail_width > 0:
-                    write(y_cursor, starts[-1] + widths[-1], tail_width, "", 0)
-
-                y_cursor += 1
-
-            if y_cursor >= data_bottom:
-                break
-
-        return scroll
+            if frame.tail_width > 0:
+                self._write(
+                    stdscr,
+                    frame,
+                    y_cursor,
+                    starts[-1] + widths[-1],
+                    frame.tail_width,
+                    "",
+                    0,
+                )
 
-    def move_selection(self, selected_idx: int, delta: int) -> int:
-        if not self.events:
+            y_cursor += 1
+        return y_cursor
+
+    def _compose_line(self, frame: "_Frame", cells: Sequence[str]) -> str:
+        parts: List[str] = []
+        for col_idx, width in enumerate(frame.widths):
+            raw = cells[col_idx]
+            align = self._ALIGNMENTS[col_idx]
+            if len(raw) > width:
+                raw = raw[-width:] if align == "right" else raw[:width]
+            if align == "right":
+                parts.append(raw.rjust(width))
+            elif align == "center":
+                parts.append(raw.center(width))
+            else:
+                parts.append(raw.ljust(width))
+        gap = " " * _GAP_WIDTH
+        return gap.join(parts) + " " * frame.tail_width
+
+    @staticmethod
+    def _write(
+        stdscr: "curses.window",  # type: ignore[name-defined]
+        frame: "_Frame",
+        y: int,
+        x: int,
+        width: int,
+        text: str,
+        attr: int = 0,
+        align: str = "left",
+    ) -> None:
+        usable_h = frame.usable_h
+        usable_w = frame.usable_w
+        if width <= 0 or y < 0 or y >= usable_h:
+            return
+        if x >= usable_w:
+            return
+        span = min(width, max(0, usable_w - x))
+        if span <= 0:
+            return
+        try:
+            raw = text or ""
+            if len(raw) > span:
+                raw = raw[-span:] if align == "right" else raw[:span]
+            if align == "right":
+                padded = raw.rjust(span)
+            elif align == "center":
+                padded = raw.center(span)
+            else:
+                padded = raw.ljust(span)
+            stdscr.addnstr(y, x, padded, span, attr)
+        except curses.error:
+            pass
+
+    @staticmethod
+    def move_selection(selected_idx: int, delta: int, count: int) -> int:
+        if count <= 0:
             return 0
-        return clamp(selected_idx + delta, 0, len(self.events) - 1)
+        return clamp(selected_idx + delta, 0, count - 1)
 
-    def jump_to_today(self) -> int:
+    def jump_day(self, selected_idx: int, direction: int) -> int | None:
+        """Return the first row of the previous/next day, or None at the edge."""
         if not self.events:
+            return None
+        cur_idx = clamp(selected_idx, 0, len(self.events) - 1)
+        cur_day = self.events[cur_idx].jtbd.x.date()
+        pos = bisect_left(self.sorted_dates, cur_day)
+        target = pos - 1 if direction < 0 else pos + 1
+        if not 0 <= target < len(self.sorted_dates):
+            return None
+        return self.first_index_by_date[self.sorted_dates[target]]
+
+    @staticmethod
+    def jump_to_today(events: Sequence[Event]) -> int:
+        if not events:
             return 0
-        today = datetime.today()
-        for idx, ev in enumerate(self.events):
-            if ev.jtbd.x >= today:
-                return idx
-        return len(self.events) - 1
-
-    def clamp_column(self, col: int) -> int:
-        return clamp(col, 0, self.COLUMN_COUNT - 1)
+        # Events are sorted by time first, so the first upcoming one bisects.
+        idx = bisect_left(events, datetime.today(), key=_event_time)
+        return min(idx, len(events) - 1)
+
+    @classmethod
+    def clamp_column(cls, col: int) -> int:
+        return clamp(col, 0, cls.COLUMN_COUNT - 1)
 
 
 __all__ = ["AgendaView"]
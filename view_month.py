@@ -6,10 +6,11 @@ from __future__ import annotations
 import calendar
 import curses
 import textwrap
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Set, Tuple
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, List, Set
 
-from models import Event
+from models import Event, EventIdentity
 from ui_base import clamp
 
 
@@ -22,6 +23,16 @@ def _max_line_length(text: str) -> int:
     return max(len(line) for line in lines)
 
 
+@lru_cache(maxsize=64)
+def _wrapper_for(width: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(
+        width=width,
+        break_long_words=True,
+        drop_whitespace=False,
+        replace_whitespace=False,
+    )
+
+
 def _wrap_text(value: str, width: int) -> List[str]:
     if width <= 0:
         return [""]
@@ -32,13 +43,11 @@ def _wrap_text(value: str, width: int) -> List[str]:
         if part == "":
             lines.append("")
             continue
-        wrapped = textwrap.wrap(
-            part,
-            width=width,
-            break_long_words=True,
-            drop_whitespace=False,
-            replace_whitespace=False,
-        )
+        if len(part) <= width and "\t" not in part:
+            # textwrap would return the part unchanged; skip its tokenizer.
+            lines.append(part)
+            continue
+        wrapped = _wrapper_for(width).wrap(part)
         if not wrapped:
             lines.append("")
         else:
@@ -46,18 +55,6 @@ def _wrap_text(value: str, width: int) -> List[str]:
     return lines or [""]
 
 
-def _event_identity(event: Event) -> Tuple[str, datetime, str, str, float, float, float]:
-    return (
-        event.bucket,
-        event.jtbd.x,
-        event.jtbd.y,
-        event.jtbd.z,
-        event.nsm.p,
-        event.nsm.q,
-        event.nsm.r,
-    )
-
-
 def _format_nsm_value(event: Event) -> str:
     score = (event.nsm.p + event.nsm.q + event.nsm.r) / 30.0
     text = f"{score:.2f}"
@@ -92,8 +89,9 @@ class MonthView:
         selected_col: int,
         *,
         expand_all: bool,
-        row_overrides: Set[Tuple[str, datetime, str, str, float, float, float]],
+        row_overrides: Set[EventIdentity],
         bucket_label: str,
+        today: date | None = None,
     ) -> None:
         h, w = stdscr.getmaxyx()
         body_h = h - 1
@@ -135,6 +133,7 @@ class MonthView:
                 grid_rows - 1,
                 body_w,
                 selected_date,
+                today or date.today(),
             )
         if events_rows > 0:
             events_start = (
@@ -191,11 +190,11 @@ class MonthView:
         h: int,
         w: int,
         selected_date: date,
+        today: date,
     ) -> None:  # type: ignore[name-defined]
         cal = calendar.Calendar(firstweekday=0)
         year, month = selected_date.year, selected_date.month
         weeks = cal.monthdatescalendar(year, month)
-        today = date.today()
 
         default_cell_w = 7
         min_cell_w = 4
@@ -241,7 +240,7 @@ class MonthView:
         selected_event_idx: int,
         selected_col: int,
         expand_all: bool,
-        row_overrides: Set[Tuple[str, datetime, str, str, float, float, float]],
+        row_overrides: Set[EventIdentity],
         bucket_label: str,
     ) -> None:
         events = self.events_by_date.get(selected_date, [])
@@ -381,7 +380,7 @@ class MonthView:
 
         rows = []
         for idx, event in enumerate(events):
-            identity = _event_identity(event)
+            identity = event.identity
             if expand_all:
                 expanded = identity not in row_overrides
             else:
@@ -393,6 +392,8 @@ class MonthView:
             z_lines = z_lines_full if expanded else z_lines_full[:1]
             y_lines = y_lines or [""]
             z_lines = z_lines or [""]
+            # Timestamp and score are single lines; only y/z set the height.
+            height = max(len(y_lines), len(z_lines))
 
             columns = [
                 [timestamps[idx]],
@@ -400,7 +401,6 @@ class MonthView:
                 z_lines,
                 [nsm_values[idx]],
             ]
-            height = max(len(lines) for lines in columns)
             rows.append(
                 {
                     "identity": identity,
@@ -443,10 +443,9 @@ class MonthView:
             row_lines = row["height"]
             columns = row["columns"]
             is_active_row = focus == "events" and idx == selected_event_idx
-            attrs = [
-                curses.A_REVERSE if (is_active_row and selected_col == col_idx) else 0
-                for col_idx in range(len(headers))
-            ]
+            attrs = [0] * len(headers)
+            if is_active_row and 0 <= selected_col < len(attrs):
+                attrs[selected_col] = curses.A_REVERSE
             for line_offset in range(row_lines):
                 if y_cursor >= data_top + data_height:
                     break
@@ -479,13 +478,16 @@ class MonthView:
             if y_cursor >= data_top + data_height:
                 break
 
-    def move_day(self, selected_date: date, delta_days: int) -> date:
+    @staticmethod
+    def move_day(selected_date: date, delta_days: int) -> date:
         return selected_date + timedelta(days=delta_days)
 
-    def move_week(self, selected_date: date, delta_weeks: int) -> date:
+    @staticmethod
+    def move_week(selected_date: date, delta_weeks: int) -> date:
         return selected_date + timedelta(days=7 * delta_weeks)
 
-    def move_month(self, selected_date: date, delta_months: int) -> date:
+    @staticmethod
+    def move_month(selected_date: date, delta_months: int) -> date:
         year = selected_date.year + ((selected_date.month - 1 + delta_months) // 12)
         month = (selected_date.month - 1 + delta_months) % 12 + 1
         day = selected_date.day
@@ -494,8 +496,11 @@ class MonthView:
         day = min(day, max_day)
         return date(year, month, day)
 
-    def clamp_event_index(self, selected_date: date, idx: int) -> int:
-        evs = self.events_by_date.get(selected_date, [])
+    @staticmethod
+    def clamp_event_index(
+        events_by_date: Dict[date, List[Event]], selected_date: date, idx: int
+    ) -> int:
+        evs = events_by_date.get(selected_date, [])
         if not evs:
             return 0
         return clamp(idx, 0, len(evs) - 1)